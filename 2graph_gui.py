@@ -1,187 +1,17 @@
-from heapq import heappush, heappop
-from collections import deque
 import math
+import multiprocessing
+import time
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
 import json
 
-INDEX_BASE = 1
+import graph_engine as engine
+from graph_engine import (
+    format_vertex, Graph, ResultCache, DynamicMST, ShortestPathTree, euclidean_scale,
+    VISIT, RELAX, ACCEPT, REJECT, TRACE_KINDS, count_events, replay_edges,
+    graph_from_json, graph_to_json,
+)
 
-label_to_index = {}
-index_to_label = {}
-
-
-def index_to_letters(i: int) -> str:
-    """แปลง 0 -> 1, 1 -> 2, ..."""
-    return str(i + 1)
-
-
-def format_vertex(i: int) -> str:
-    return index_to_letters(i)
-
-
-def parse_vertex_token(tok: str) -> int:
-    tok = tok.strip()
-    if tok.isdigit():
-        return int(tok) - INDEX_BASE
-    if tok in label_to_index:
-        return label_to_index[tok]
-    print("Unknown vertex label:", tok)
-    raise SystemExit
-
-
-class Graph:
-    def __init__(self, n):
-        self.n = n
-        self.adj = [[] for _ in range(n)]
-        self.edges = []
-
-    def add_edge(self, u, v, w):
-        self.adj[u].append((v, w))
-        self.adj[v].append((u, w))
-        self.edges.append((w, u, v))
-        self.edges.append((w, v, u))
-
-
-# ---------- DFS ----------
-def dfs_spanning_tree(g, start):
-    visited = [False] * g.n
-    tree = []
-
-    def dfs(u):
-        visited[u] = True
-        for v, w in g.adj[u]:
-            if not visited[v]:
-                tree.append((u, v, w))
-                dfs(v)
-
-    dfs(start)
-    unreach = [i for i in range(g.n) if not visited[i]]
-    return tree, unreach
-
-
-# ---------- BFS ----------
-def bfs_spanning_tree(g, start):
-    visited = [False] * g.n
-    tree = []
-    q = deque()
-
-    visited[start] = True
-    q.append(start)
-
-    while q:
-        u = q.popleft()
-        for v, w in g.adj[u]:
-            if not visited[v]:
-                visited[v] = True
-                tree.append((u, v, w))
-                q.append(v)
-
-    unreach = [i for i in range(g.n) if not visited[i]]
-    return tree, unreach
-
-
-# ---------- Dijkstra ----------
-def dijkstra(g, src, dest):
-    dist = [math.inf] * g.n
-    parent = [-1] * g.n
-
-    dist[src] = 0
-    heap = [(0, src)]
-
-    while heap:
-        d, u = heappop(heap)
-        if d != dist[u]:
-            continue
-        if u == dest:
-            break
-
-        for v, w in g.adj[u]:
-            nd = d + w
-            if nd < dist[v]:
-                dist[v] = nd
-                parent[v] = u
-                heappush(heap, (nd, v))
-
-    if dist[dest] == math.inf:
-        return math.inf, []
-
-    path = []
-    cur = dest
-    while cur != -1:
-        path.append(cur)
-        cur = parent[cur]
-    path.reverse()
-
-    return dist[dest], path
-
-
-# ---------- Prim ----------
-def prim(g, start):
-    visited = [False] * g.n
-    visited[start] = True
-    heap = []
-
-    for v, w in g.adj[start]:
-        heappush(heap, (w, start, v))
-
-    mst = []
-    total = 0
-
-    while heap and len(mst) < g.n - 1:
-        w, u, v = heappop(heap)
-        if visited[v]:
-            continue
-
-        visited[v] = True
-        mst.append((u, v, w))
-        total += w
-
-        for to, ww in g.adj[v]:
-            if not visited[to]:
-                heappush(heap, (ww, v, to))
-
-    if len(mst) != g.n - 1:
-        return None, math.inf
-    return mst, total
-
-
-# ---------- Kruskal ----------
-def kruskal(g):
-    parent = [i for i in range(g.n)]
-    rank = [0] * g.n
-
-    def find(x):
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
-
-    def union(a, b):
-        ra, rb = find(a), find(b)
-        if ra == rb:
-            return False
-        if rank[ra] < rank[rb]:
-            parent[ra] = rb
-        elif rank[ra] > rank[rb]:
-            parent[rb] = ra
-        else:
-            parent[rb] = ra
-            rank[ra] += 1
-        return True
-
-    mst = []
-    total = 0
-
-    for w, u, v in sorted(g.edges):
-        if union(u, v):
-            mst.append((u, v, w))
-            total += w
-            if len(mst) == g.n - 1:
-                break
-
-    if len(mst) != g.n - 1:
-        return None, math.inf
-    return mst, total
 
 # ---------- Modern Floating Dropdown with Smooth Animation ----------
 class FloatingDropdown(tk.Frame):
@@ -414,6 +244,15 @@ class ResultPanel(tk.Frame):
         )
         self.status_label.pack(side="right")
 
+        self.components_label = tk.Label(
+            title_bar,
+            text="",
+            font=("SF Pro Text", 9),
+            fg="#636366",
+            bg="#1c1c1e"
+        )
+        self.components_label.pack(side="right", padx=(0, 8))
+
         # Text area with custom scrollbar
         text_container = tk.Frame(self, bg="#1c1c1e")
         text_container.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 12))
@@ -463,6 +302,9 @@ class ResultPanel(tk.Frame):
         self.text.insert(tk.END, text)
         self.text.see(tk.END)
 
+    def set_components(self, count):
+        self.components_label.configure(text=f"{count} component{'s' if count != 1 else ''}")
+
 # ---------- Main Graph GUI Application ----------
 class GraphGUI:
     def __init__(self, root):
@@ -498,9 +340,20 @@ class GraphGUI:
         # Edge colors
         self.edge_color = "#48484a"
         self.edge_highlight_color = "#ff375f"
+        self.live_mst_color = "#30d158"
         self.edge_selected_color = "#af52de"
+        self.trace_visit_color = "#5e5ce6"
+        self.trace_relax_color = "#ff9f0a"
+        self.trace_reject_color = "#636366"
+        # components / multi-source BFS regions (cycled when there are more)
+        self.region_palette = ["#30d158", "#ff9f0a", "#af52de", "#ff375f", "#64d2ff",
+                               "#ffd60a", "#5e5ce6", "#ff453a", "#66d4cf", "#bf5af2"]
         
         self.anim_delay = 320  # Smoother animation timing
+        self.trace_frame_ms = 8  # max work per tick between accepted edges
+        self.generator_nodes = 200  # defaults for File → Generate
+        self.generator_seed = 1
+        self.landmark_count = 8  # ALT preprocessing: landmarks per graph
 
         self.root.configure(bg=self.bg_main)
 
@@ -514,6 +367,15 @@ class GraphGUI:
         file_menu.add_command(label="New Graph       ⌘N", command=self.clear_graph)
         file_menu.add_command(label="Open...         ⌘O", command=self.load_graph)
         file_menu.add_command(label="Save As...      ⌘S", command=self.save_graph)
+        generate_menu = tk.Menu(file_menu, tearoff=0, bg=self.bg_panel,
+                                fg=self.text_primary, activebackground=self.accent_blue,
+                                activeforeground=self.text_primary)
+        for family, label in (("er", "Erdős–Rényi (random)"), ("grid", "2D Grid"),
+                              ("geometric", "Random Geometric"), ("ba", "Barabási–Albert"),
+                              ("knn", "k-Nearest Neighbours")):
+            generate_menu.add_command(label=label,
+                                      command=lambda f=family, l=label: self.generate_graph(f, l))
+        file_menu.add_cascade(label="Generate", menu=generate_menu)
         file_menu.add_separator()
         file_menu.add_command(label="Exit            ⌘Q", command=self.root.quit)
         menubar.add_cascade(label="File", menu=file_menu)
@@ -569,11 +431,22 @@ class GraphGUI:
 
         self.alg_buttons["dfs"] = self.alg_dropdown.add_item("DFS Traversal", self.choose_dfs, "🌲")
         self.alg_buttons["bfs"] = self.alg_dropdown.add_item("BFS Traversal", self.choose_bfs, "🔄")
+        self.alg_buttons["msbfs"] = self.alg_dropdown.add_item(
+            "Multi-Source BFS (selected)", self.run_multi_bfs, "🌊")
+        self.alg_buttons["components"] = self.alg_dropdown.add_item(
+            "Connected Components", self.run_components, "🗺")
         self.alg_dropdown.add_separator()
         self.alg_buttons["dijkstra"] = self.alg_dropdown.add_item("Dijkstra Path", self.choose_dijkstra, "🎯")
+        self.alg_buttons["bidijkstra"] = self.alg_dropdown.add_item(
+            "Bidirectional Dijkstra", lambda: self.choose_dijkstra("bidijkstra"), "⇄")
+        self.alg_buttons["astar"] = self.alg_dropdown.add_item("A* Path", lambda: self.choose_dijkstra("astar"), "⭐")
+        self.alg_buttons["alt"] = self.alg_dropdown.add_item("ALT Landmark Path", lambda: self.choose_dijkstra("alt"), "📍")
+        self.alg_buttons["ch"] = self.alg_dropdown.add_item("Contraction Hierarchy", lambda: self.choose_dijkstra("ch"), "🏔")
         self.alg_dropdown.add_separator()
         self.alg_buttons["prim"] = self.alg_dropdown.add_item("Prim MST", self.choose_prim, "🌳")
         self.alg_buttons["kruskal"] = self.alg_dropdown.add_item("Kruskal MST", self.run_kruskal, "🔗")
+        self.alg_buttons["boruvka"] = self.alg_dropdown.add_item("Borůvka MST", self.run_boruvka, "🧩")
+        self.alg_buttons["live_mst"] = self.alg_dropdown.add_item("Live MST (toggle)", self.toggle_live_mst, "🌿")
 
         # Tools Dropdown
         self.tools_dropdown = FloatingDropdown(
@@ -623,14 +496,24 @@ class GraphGUI:
         self.node_radius = 20
         self.node_positions = []
         self.node_items = {}
+        self.node_shadows = {}
         self.edge_items = {}
         self.line_to_edge = {}
         self.text_to_edge = {}
         self.graph = Graph(0)
+        self.landmarks = None
+        self.hierarchy = None
+        self.astar_scale = None  # (csr, scale) of the A* heuristic
+        self.live_mst = None
+        self.result_cache = ResultCache()
+        self.path_trees = ResultCache(maxsize=16)  # src -> ShortestPathTree
+        self._trace_token = 0  # bumped to cancel the trace being played
+        self._component_status_pending = False
 
         self.mode = "build"
         self.edge_start = None
         self.dijkstra_src = None
+        self.path_algorithm = "dijkstra"
         self.dragging_node = None
         self.last_mouse_pos = None
         self.pan_last_pos = None
@@ -658,6 +541,7 @@ class GraphGUI:
         self.view_dropdown.close()
 
         self.log_welcome()
+        self.update_component_status()
 
     def log_welcome(self):
         welcome = """Welcome to Graph Visualizer! 🎨
@@ -681,6 +565,30 @@ Ready to create your graph!"""
     def log(self, text, status=""):
         self.result_panel.log(text, status)
 
+    def memory_summary(self, csr):
+        """One-line memory comparison between the editor lists and the CSR run copy."""
+        m = csr.num_edges
+        if m == 0:
+            return "Memory: (no edges)"
+        staging = self.graph.nbytes() / m
+        return f"Memory: {csr.bytes_per_edge():.1f} B/edge CSR vs {staging:.1f} B/edge lists"
+
+    def graph_changed(self):
+        """Drop everything derived from the old graph after an edit."""
+        self.landmarks = None
+        self.hierarchy = None
+        self.astar_scale = None
+        self.path_trees = ResultCache(maxsize=16)
+        self._trace_token += 1  # a trace still playing shows the old graph
+        if not self._component_status_pending:
+            # coalesce a burst of edits into one (possibly rebuilding) query
+            self._component_status_pending = True
+            self.root.after_idle(self.update_component_status)
+
+    def update_component_status(self):
+        self._component_status_pending = False
+        self.result_panel.set_components(self.graph.component_count())
+
     def set_mode(self, mode):
         self.mode = mode
         # Update cursor
@@ -708,13 +616,15 @@ Ready to create your graph!"""
     def find_node_at(self, x, y):
         for i, (nx, ny) in enumerate(self.node_positions):
             dx, dy = x - nx, y - ny
-            if dx * dx + dy * dy <= self.node_radius * self.node_radius:
+            if dx * dx + dy * dy <= self.node_radius * self.node_radius and i in self.node_items:
                 return i
         return None
 
     def reset_node_colors(self):
-        for idx, (circle_id, text_id) in self.node_items.items():
-            self.canvas.itemconfig(circle_id, fill=self.default_node_color, 
+        self.run_canvas_script([self.reset_nodes_script(self.node_items)])
+
+    def reset_nodes_script(self, nodes):
+        return self.config_script(self.node_circles(nodes), fill=self.default_node_color,
                                   outline=self.default_node_outline, width=2)
 
     def highlight_node(self, idx, color=None, glow=True):
@@ -725,9 +635,29 @@ Ready to create your graph!"""
         width = 3 if glow else 2
         self.canvas.itemconfig(circle_id, fill=color, outline=color, width=width)
 
+    def config_script(self, item_ids, **options):
+        """Tcl foreach applying itemconfig(**options) to every canvas item in item_ids."""
+        opts = " ".join(f"-{key} {{{value}}}" for key, value in options.items())
+        ids = " ".join(map(str, item_ids))
+        return f"foreach i {{{ids}}} {{{self.canvas} itemconfigure $i {opts}}}"
+
+    def run_canvas_script(self, lines):
+        """Apply config_script() lines in one round trip instead of a call per item."""
+        if lines:
+            self.canvas.tk.eval("\n".join(lines))
+
+    def node_circles(self, nodes):
+        return [self.node_items[v][0] for v in nodes if v in self.node_items]
+
+    def edge_lines(self, pairs):
+        return [self.edge_items[e][0] for e in pairs if e in self.edge_items]
+
     def reset_edge_colors(self):
-        for (u, v), (line_id, text_id, w) in self.edge_items.items():
-            self.canvas.itemconfig(line_id, fill=self.edge_color, width=2, dash=())
+        self.run_canvas_script([self.reset_edges_script()])
+
+    def reset_edges_script(self):
+        lines = {line_id for line_id, _, _ in self.edge_items.values()}
+        return self.config_script(lines, fill=self.edge_color, width=2, dash="")
 
     def reset_all_colors(self):
         self.reset_node_colors()
@@ -751,6 +681,7 @@ Ready to create your graph!"""
 # --- Animation Methods ---
     def animate_edges(self, edge_list, header_lines):
         """Animate edges with smooth wave effect"""
+        self._trace_token += 1  # a result replaces any trace still playing
         if not edge_list:
             self.log("\n".join(header_lines) + "\n\n(No edges in result)")
             return
@@ -762,6 +693,16 @@ Ready to create your graph!"""
         self.log("\n".join(step_lines), f"{len(edge_list)} edges")
         self.reset_edge_colors()
 
+        def step(i):
+            if i >= len(edge_list):
+                return
+            u, v, w = edge_list[i]
+            self._highlight_edge(u, v)
+            self.root.after(self.anim_delay, lambda: step(i + 1))
+
+        step(0)
+
+    def _highlight_edge(self, u, v):
         def pulse_wave(line_id, k, color):
             """Smooth pulsing wave animation"""
             if k <= 0:
@@ -772,20 +713,84 @@ Ready to create your graph!"""
             self.canvas.itemconfig(line_id, width=int(intensity))
             self.root.after(60, lambda: pulse_wave(line_id, k - 1, color))
 
-        def step(i):
-            if i >= len(edge_list):
+        item = self.edge_items.get((u, v)) or self.edge_items.get((v, u))
+        if item:
+            line_id, text_id, _ = item
+            self.canvas.itemconfig(line_id, fill=self.edge_highlight_color, dash=(6, 3))
+            self.canvas.itemconfig(text_id, fill=self.accent_pink, 
+                                  font=("SF Mono", 11, "bold"))
+            pulse_wave(line_id, 8, self.edge_highlight_color)
+
+    def play_trace(self, events, header_lines, on_done=None, key_label="weight",
+                   step_accepts=True):
+        """Animate a step-event trace, pulling events only as frames need them.
+
+        Accepted edges are drawn one per anim_delay, like animate_edges;
+        visits, relaxations and rejects in between are tinted within a tick
+        of at most trace_frame_ms, so long runs of rejects never stall the
+        event loop.  With step_accepts=False accepted edges are tinted under
+        the same frame budget, without a "Step" line each (a search tree
+        grows one edge per settled node, too many to step through).
+        on_done(accepted, counts) runs when the trace ends.  Starting
+        another trace or editing the graph cancels this one.
+        """
+        self._trace_token += 1
+        token = self._trace_token
+        self.log("\n".join(header_lines), "Running…")
+        self.reset_node_colors()
+        self.reset_edge_colors()
+        counts = dict.fromkeys(TRACE_KINDS, 0)
+        events = count_events(events, counts)
+        accepted = []
+        tree = set()
+        budget = self.trace_frame_ms / 1000
+
+        def tick():
+            if token != self._trace_token:
                 return
-            u, v, w = edge_list[i]
-            item = self.edge_items.get((u, v)) or self.edge_items.get((v, u))
-            if item:
-                line_id, text_id, _ = item
-                self.canvas.itemconfig(line_id, fill=self.edge_highlight_color, dash=(6, 3))
-                self.canvas.itemconfig(text_id, fill=self.accent_pink, 
-                                      font=("SF Mono", 11, "bold"))
-                pulse_wave(line_id, 8, self.edge_highlight_color)
-            self.root.after(self.anim_delay, lambda: step(i + 1))
+            deadline = time.perf_counter() + budget
+            for kind, u, v, w in events:
+                if kind == ACCEPT:
+                    accepted.append((u, v, w))
+                    tree.add((u, v))
+                    tree.add((v, u))
+                    if step_accepts:
+                        self.result_panel.append(f"\nStep {len(accepted)}: {format_vertex(u)} → "
+                                                 f"{format_vertex(v)} ({key_label}={w})")
+                        self._highlight_edge(u, v)
+                        self.root.after(self.anim_delay, tick)
+                        return
+                    item = self.edge_items.get((u, v))
+                    if item:
+                        self.canvas.itemconfig(item[0], fill=self.trace_visit_color, dash=())
+                elif kind == VISIT:
+                    self.highlight_node(v, self.trace_visit_color, glow=False)
+                elif kind == RELAX or kind == REJECT:
+                    if (u, v) not in tree:
+                        self._tint_edge(u, v, kind == REJECT)
+                if time.perf_counter() > deadline:
+                    self.root.after(1, tick)
+                    return
+            if not accepted:
+                self.result_panel.append("\n(No edges in result)")
+            self.result_panel.append("\n" + self.trace_summary(counts))
+            self.result_panel.status_label.configure(text=f"{len(accepted)} edges")
+            if on_done:
+                on_done(accepted, counts)
+
+        tick()
+
+    def _tint_edge(self, u, v, rejected):
+        item = self.edge_items.get((u, v))
+        if item:
+            if rejected:
+                self.canvas.itemconfig(item[0], fill=self.trace_reject_color, dash=(2, 4))
+            else:
+                self.canvas.itemconfig(item[0], fill=self.trace_relax_color, dash=())
 
-        step(0)
+    def trace_summary(self, counts):
+        parts = [f"{counts[k]} {k}" for k in TRACE_KINDS if counts.get(k)]
+        return f"Events: {' · '.join(parts) or 'none'}"
 
     def animate_path_nodes(self, path, delay=0):
         """Animate nodes along a path with stagger effect"""
@@ -831,19 +836,11 @@ Ready to create your graph!"""
 
     # --- Node & Edge Creation ---
     def add_node(self, x, y):
-        idx = len(self.node_positions)
+        idx = self.graph.add_node()
         self.node_positions.append((x, y))
-
-        # Expand graph
-        new_g = Graph(idx + 1)
-        for u in range(self.graph.n):
-            for v, w in self.graph.adj[u]:
-                if u < new_g.n and v < new_g.n:
-                    new_g.adj[u].append((v, w))
-        for w, u, v in self.graph.edges:
-            if u < new_g.n and v < new_g.n:
-                new_g.edges.append((w, u, v))
-        self.graph = new_g
+        self.graph_changed()
+        if self.live_mst is not None:
+            self.live_mst.add_node()
 
         # แทนที่ fill="#00000040" ด้วยสีทึบ
         shadow = self.canvas.create_oval(
@@ -869,6 +866,7 @@ Ready to create your graph!"""
         )
         
         self.node_items[idx] = (circle_id, text_id)
+        self.node_shadows[idx] = shadow
         
         # Pop-in animation
         self._pop_in_node(circle_id, text_id, x, y)
@@ -983,6 +981,7 @@ Ready to create your graph!"""
             return
 
         self.graph.add_edge(u, v, w)
+        self.graph_changed()
 
         sx, sy, ex, ey = self.edge_coords(u, v)
         line_id = self.canvas.create_line(
@@ -1011,6 +1010,11 @@ Ready to create your graph!"""
         # Draw animation
         self._draw_edge_animation(line_id)
 
+        if self.live_mst is not None:
+            t0 = time.perf_counter()
+            added, removed = self.live_mst.insert(u, v, w)
+            self.update_live_mst(added, removed, time.perf_counter() - t0)
+
     def _draw_edge_animation(self, line_id):
         """Animate edge drawing with dash effect"""
         def animate(step):
@@ -1044,17 +1048,8 @@ Ready to create your graph!"""
         self._fade_out_edge(line_id, weight_id)
 
         # Update graph structure
-        self.graph.adj[u] = [(to, ww) for (to, ww) in self.graph.adj[u] 
-                            if not (to == v and ww == w)]
-        self.graph.adj[v] = [(to, ww) for (to, ww) in self.graph.adj[v] 
-                            if not (to == u and ww == w)]
-
-        new_edges = []
-        for ww, uu, vv in self.graph.edges:
-            if (uu == u and vv == v and ww == w) or (uu == v and vv == u and ww == w):
-                continue
-            new_edges.append((ww, uu, vv))
-        self.graph.edges = new_edges
+        self.graph.remove_edge(u, v, w)
+        self.graph_changed()
 
         # Clean up references
         for key in [(u, v), (v, u)]:
@@ -1066,6 +1061,11 @@ Ready to create your graph!"""
         if weight_id in self.text_to_edge:
             del self.text_to_edge[weight_id]
 
+        if self.live_mst is not None:
+            t0 = time.perf_counter()
+            added, removed = self.live_mst.delete(self.graph, u, v, w)
+            self.update_live_mst(added, removed, time.perf_counter() - t0)
+
     def _fade_out_edge(self, line_id, weight_id):
         """Fade out animation for edge deletion"""
         def fade(step):
@@ -1080,79 +1080,52 @@ Ready to create your graph!"""
         fade(0)
 
     def delete_node(self, del_idx):
-        if del_idx < 0 or del_idx >= self.graph.n:
+        """Remove one node in place: ids, labels and positions of the others stay put."""
+        if not self.graph.is_live(del_idx):
             return
 
-        if del_idx in self.node_items:
-            circle_id, text_id = self.node_items[del_idx]
-            # Fade out animation
-            def shrink(step):
-                if step > 5:
-                    self.canvas.delete(circle_id)
-                    self.canvas.delete(text_id)
-                    return
-                scale = 1.0 - (step / 5.0)
-                x, y = self.node_positions[del_idx]
-                r = self.node_radius * scale
-                self.canvas.coords(circle_id, x - r, y - r, x + r, y + r)
-                self.root.after(40, lambda: shrink(step + 1))
-            shrink(0)
-
-        # Delete connected edges
-        to_delete_lines = set()
-        to_delete_texts = set()
-        for (u, v), (line_id, weight_id, w) in list(self.edge_items.items()):
-            if u == del_idx or v == del_idx:
-                to_delete_lines.add(line_id)
-                to_delete_texts.add(weight_id)
-                del self.edge_items[(u, v)]
-
-        for line_id in to_delete_lines:
+        circle_id, text_id = self.node_items.pop(del_idx)
+        self.canvas.delete(self.node_shadows.pop(del_idx))
+        # Fade out animation
+        def shrink(step):
+            if step > 5:
+                self.canvas.delete(circle_id)
+                self.canvas.delete(text_id)
+                return
+            scale = 1.0 - (step / 5.0)
+            x, y = self.node_positions[del_idx]
+            r = self.node_radius * scale
+            self.canvas.coords(circle_id, x - r, y - r, x + r, y + r)
+            self.root.after(40, lambda: shrink(step + 1))
+        shrink(0)
+
+        removed = self.graph.remove_node(del_idx)
+        for u, v, w in removed:
+            items = self.edge_items.pop((u, v), None)
+            self.edge_items.pop((v, u), None)
+            if items is None:
+                continue  # a parallel edge whose line is already gone
+            line_id, weight_id, _ = items
             self.canvas.delete(line_id)
-            if line_id in self.line_to_edge:
-                del self.line_to_edge[line_id]
-        for text_id in to_delete_texts:
-            self.canvas.delete(text_id)
-            if text_id in self.text_to_edge:
-                del self.text_to_edge[text_id]
-
-        # Remap indices
-        old_n = self.graph.n
-        idx_map = {}
-        new_idx = 0
-        for old_idx in range(old_n):
-            if old_idx == del_idx:
-                continue
-            idx_map[old_idx] = new_idx
-            new_idx += 1
-
-        # Rebuild graph
-        new_g = Graph(old_n - 1)
-        for w, u, v in self.graph.edges:
-            if u == del_idx or v == del_idx:
-                continue
-            nu = idx_map[u]
-            nv = idx_map[v]
-            if nu <= nv:
-                new_g.add_edge(nu, nv, w)
-        self.graph = new_g
-
-        # Update positions
-        new_positions = []
-        for old_idx, pos in enumerate(self.node_positions):
-            if old_idx == del_idx:
-                continue
-            new_positions.append(pos)
-        self.node_positions = new_positions
-
-        # Update selection
-        new_selected = set()
-        for old_idx, new_idx in idx_map.items():
-            if old_idx in self.selected_nodes:
-                new_selected.add(new_idx)
-        self.selected_nodes = new_selected
-
-        self.root.after(250, self.redraw_all)
+            self.canvas.delete(weight_id)
+            self.line_to_edge.pop(line_id, None)
+            self.text_to_edge.pop(weight_id, None)
+        self.graph_changed()
+
+        self.selected_nodes.discard(del_idx)
+        if self.edge_start == del_idx:
+            self.edge_start = None
+        if self.dijkstra_src == del_idx:
+            self.dijkstra_src = None
+        if self.live_mst is not None:
+            t0 = time.perf_counter()
+            added, dropped = [], []
+            for u, v, w in removed:
+                a, d = self.live_mst.delete(self.graph, u, v, w)
+                added += a
+                dropped += d
+            self.live_mst.remove_node()
+            self.update_live_mst(added, dropped, time.perf_counter() - t0)
 
     def delete_selected(self):
         if not self.selected_nodes:
@@ -1165,16 +1138,18 @@ Ready to create your graph!"""
         self.log(f"Deleted {count} node(s)", "Done")
 
     def select_all(self):
-        self.selected_nodes = set(range(self.graph.n))
+        self.selected_nodes = set(self.node_items)
         self.reset_node_colors()
         for idx in self.selected_nodes:
             self.highlight_node(idx, self.selected_node_color, glow=False)
-        self.log(f"Selected all {self.graph.n} nodes", f"{self.graph.n} nodes")
+        count = len(self.selected_nodes)
+        self.log(f"Selected all {count} nodes", f"{count} nodes")
 
     def redraw_all(self):
         """Redraw entire graph with smooth transitions"""
         self.canvas.delete("all")
         self.node_items.clear()
+        self.node_shadows.clear()
         self.edge_items.clear()
         self.line_to_edge.clear()
         self.text_to_edge.clear()
@@ -1209,6 +1184,8 @@ Ready to create your graph!"""
 
         # Draw nodes with shadows
         for idx, (x, y) in enumerate(self.node_positions):
+            if idx in self.graph.removed:
+                continue
             shadow = self.canvas.create_oval(
                 x - self.node_radius + 2, y - self.node_radius + 2,
                 x + self.node_radius + 2, y + self.node_radius + 2,
@@ -1230,15 +1207,19 @@ Ready to create your graph!"""
                 font=("SF Pro Display", 12, "bold")
             )
             self.node_items[idx] = (circle_id, text_id)
+            self.node_shadows[idx] = shadow
 
         # Restore selection highlights
         for idx in self.selected_nodes:
             if idx in self.node_items:
                 self.highlight_node(idx, self.selected_node_color, glow=False)
 
+        if self.live_mst is not None:
+            self.update_live_mst(self.live_mst.edges(), [])
+
     def clear_graph(self):
         """Clear entire graph with confirmation"""
-        if self.graph.n > 0:
+        if self.graph.num_nodes > 0:
             response = messagebox.askyesno(
                 "Clear Graph",
                 "Are you sure you want to clear the entire graph?",
@@ -1250,10 +1231,13 @@ Ready to create your graph!"""
         self.canvas.delete("all")
         self.node_positions = []
         self.node_items.clear()
+        self.node_shadows.clear()
         self.edge_items.clear()
         self.line_to_edge.clear()
         self.text_to_edge.clear()
         self.graph = Graph(0)
+        self.graph_changed()
+        self.live_mst = None
         self.mode = "build"
         self.edge_start = None
         self.dijkstra_src = None
@@ -1277,6 +1261,7 @@ Ready to create your graph!"""
             dy = y - cy
             new_positions.append((cx + dx * factor, cy + dy * factor))
         self.node_positions = new_positions
+        self.astar_scale = None
         self.redraw_all()
 
     def zoom(self, factor):
@@ -1294,8 +1279,11 @@ Ready to create your graph!"""
         if not self.node_positions:
             return
         
-        xs = [x for x, y in self.node_positions]
-        ys = [y for x, y in self.node_positions]
+        live = [self.node_positions[i] for i in self.node_items]
+        if not live:
+            return
+        xs = [x for x, y in live]
+        ys = [y for x, y in live]
         
         min_x, max_x = min(xs), max(xs)
         min_y, max_y = min(ys), max(ys)
@@ -1327,6 +1315,7 @@ Ready to create your graph!"""
             new_positions.append((nx, ny))
         
         self.node_positions = new_positions
+        self.astar_scale = None
         self.redraw_all()
 
     # --- Mouse Wheel Handlers ---
@@ -1465,7 +1454,7 @@ Ready to create your graph!"""
                     messagebox.showinfo("Dijkstra", "Now click the destination node", parent=self.root)
                 else:
                     self.highlight_node(idx, self.target_node_color, glow=True)
-                    self.run_dijkstra(self.dijkstra_src, idx)
+                    self.run_path_query(self.dijkstra_src, idx)
                     self.set_active_algorithm(None)
                     self.set_mode("build")
                     self.dijkstra_src = None
@@ -1505,6 +1494,7 @@ Ready to create your graph!"""
                     self.canvas.coords(circle_id, nx + dx - r, ny + dy - r, 
                                      nx + dx + r, ny + dy + r)
                     self.canvas.coords(text_id, nx + dx, ny + dy)
+                self.astar_scale = None
 
                 for (u, v), (line_id, weight_id, w) in self.edge_items.items():
                     if u in moving or v in moving:
@@ -1556,6 +1546,7 @@ Ready to create your graph!"""
                 self.canvas.coords(circle_id, nx + dx - r, ny + dy - r, 
                                  nx + dx + r, ny + dy + r)
                 self.canvas.coords(text_id, nx + dx, ny + dy)
+            self.astar_scale = None
 
             for (u, v), (line_id, weight_id, w) in self.edge_items.items():
                 if u in moving or v in moving:
@@ -1578,7 +1569,7 @@ Ready to create your graph!"""
             y_min, y_max = sorted([y0, y1])
             self.selected_nodes = set()
             for idx, (nx, ny) in enumerate(self.node_positions):
-                if x_min <= nx <= x_max and y_min <= ny <= y_max:
+                if x_min <= nx <= x_max and y_min <= ny <= y_max and idx in self.node_items:
                     self.selected_nodes.add(idx)
             if self.selection_rect is not None:
                 self.canvas.delete(self.selection_rect)
@@ -1596,7 +1587,7 @@ Ready to create your graph!"""
     
 # --- Save & Load Methods ---
     def save_graph(self):
-        if not self.node_positions:
+        if self.graph.num_nodes == 0:  # positions outlive deleted nodes
             messagebox.showinfo("Save Graph", "No graph to save!", parent=self.root)
             return
         
@@ -1608,15 +1599,7 @@ Ready to create your graph!"""
         if not path:
             return
         
-        edges_set = set()
-        for w, u, v in self.graph.edges:
-            a, b = sorted((u, v))
-            edges_set.add((a, b, w))
-        
-        data = {
-            "nodes": [{"x": x, "y": y} for (x, y) in self.node_positions],
-            "edges": [{"u": u, "v": v, "w": w} for (u, v, w) in edges_set],
-        }
+        data = graph_to_json(self.graph, self.node_positions)
         
         try:
             with open(path, "w", encoding="utf-8") as f:
@@ -1640,29 +1623,64 @@ Ready to create your graph!"""
             messagebox.showerror("Load Error", f"Failed to load file:\n{e}", parent=self.root)
             return
 
-        nodes = data.get("nodes", [])
-        edges = data.get("edges", [])
+        try:
+            graph, positions = graph_from_json(data)
+        except (KeyError, TypeError, ValueError) as e:
+            messagebox.showerror("Load Error", f"Invalid graph file:\n{e}", parent=self.root)
+            return
+        self.replace_graph(graph, positions)
+        self.log(f"✓ Graph loaded from:\n{path}\n\nNodes: {graph.n}, Edges: {len(graph.edges)}", "Loaded")
 
-        self.node_positions = [(float(n["x"]), float(n["y"])) for n in nodes]
-        n = len(self.node_positions)
-        self.graph = Graph(n)
-        
-        for e in edges:
-            u = int(e["u"])
-            v = int(e["v"])
-            w = float(e["w"])
-            if 0 <= u < n and 0 <= v < n:
-                self.graph.add_edge(u, v, w)
+    def replace_graph(self, graph, positions):
+        """Swap in a whole new graph (loaded or generated) and redraw it."""
+        self.graph, self.node_positions = graph, positions
+        self.graph_changed()
+        if self.live_mst is not None:
+            self.live_mst = DynamicMST(self.graph)
 
         self.selected_nodes = set()
         self.redraw_all()
         self.set_mode("build")
         self.set_active_algorithm(None)
-        self.log(f"✓ Graph loaded from:\n{path}\n\nNodes: {n}, Edges: {len(edges)}", "Loaded")
+
+    def generate_graph(self, family, title):
+        """File → Generate: a seeded random graph laid out to fill the canvas."""
+        n = simpledialog.askinteger(title, "Number of nodes:", parent=self.root,
+                                    initialvalue=self.generator_nodes, minvalue=1, maxvalue=100000)
+        if n is None:
+            return
+        seed = simpledialog.askinteger(title, "Random seed (same seed, same graph):",
+                                       parent=self.root, initialvalue=self.generator_seed)
+        if seed is None:
+            return
+        if self.graph.num_nodes > 0 and not messagebox.askyesno(
+                title, "Replace the current graph?", parent=self.root):
+            return
+        self.generator_nodes, self.generator_seed = n, seed
+        try:
+            from graph_engine import generate
+        except ImportError:
+            messagebox.showerror(title, "Generating graphs needs NumPy:\npip install numpy",
+                                 parent=self.root)
+            return
+
+        t0 = time.perf_counter()
+        try:
+            graph, unit = generate(family, n, seed=seed)
+        except ValueError as e:
+            messagebox.showerror(title, f"Cannot generate this graph:\n{e}", parent=self.root)
+            return
+        elapsed = time.perf_counter() - t0
+        pad = 80
+        w = max(self.canvas.winfo_width(), 2 * pad + 1) - 2 * pad
+        h = max(self.canvas.winfo_height(), 2 * pad + 1) - 2 * pad
+        self.replace_graph(graph, [(pad + x * w, pad + y * h) for x, y in unit])
+        self.log(f"✓ Generated {title} graph (seed {seed}) in {elapsed * 1000:.0f} ms\n\n"
+                 f"Nodes: {graph.n}, Edges: {len(graph.edges)}", "Generated")
 
     # --- Algorithm Mode Choosers ---
     def choose_dfs(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("DFS", "Graph is empty! Add nodes first.", parent=self.root)
             return
         self.mode = "dfs"
@@ -1671,7 +1689,7 @@ Ready to create your graph!"""
         messagebox.showinfo("DFS", "Click any node to start DFS traversal", parent=self.root)
 
     def choose_bfs(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("BFS", "Graph is empty! Add nodes first.", parent=self.root)
             return
         self.mode = "bfs"
@@ -1680,7 +1698,7 @@ Ready to create your graph!"""
         messagebox.showinfo("BFS", "Click any node to start BFS traversal", parent=self.root)
 
     def choose_prim(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("Prim MST", "Graph is empty! Add nodes first.", parent=self.root)
             return
         self.mode = "prim"
@@ -1688,125 +1706,416 @@ Ready to create your graph!"""
         self.set_active_algorithm("prim")
         messagebox.showinfo("Prim MST", "Click any node to start Prim's algorithm", parent=self.root)
 
-    def choose_dijkstra(self):
-        if self.graph.n == 0:
+    def choose_dijkstra(self, algorithm="dijkstra"):
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("Dijkstra", "Graph is empty! Add nodes first.", parent=self.root)
             return
         self.mode = "dijkstra_src"
+        self.path_algorithm = algorithm
         self.reset_node_colors()
-        self.set_active_algorithm("dijkstra")
+        self.set_active_algorithm(algorithm)
         messagebox.showinfo("Dijkstra", "Click the source node", parent=self.root)
 
     # --- Algorithm Runners ---
     def run_dfs(self, start):
-        tree, un = dfs_spanning_tree(self.graph, start)
-        
-        header = ["🌲 DFS Spanning Tree"]
-        header.append(f"Starting from: {format_vertex(start)}")
-        
-        if tree:
-            seq = [format_vertex(start)]
-            for u, v, w in tree:
-                seq.append(format_vertex(v))
-            header.append(f"Traversal order: {' → '.join(seq)}")
-        
-        if un:
-            un_labels = [format_vertex(i) for i in un]
-            header.append(f"⚠️ Unreachable nodes: {', '.join(un_labels)}")
-        
-        header.append("")
-        self.animate_edges(tree, header)
+        self.run_traversal("dfs", "🌲 DFS Spanning Tree", start)
 
     def run_bfs(self, start):
-        tree, un = bfs_spanning_tree(self.graph, start)
-        
-        header = ["🔄 BFS Spanning Tree"]
+        self.run_traversal("bfs", "🔄 BFS Spanning Tree", start)
+
+    def run_traversal(self, name, heading, start):
+        """Play a DFS/BFS trace, or replay the cached tree for this graph version."""
+        csr = self.graph.freeze()
+        key = (name, start, self.graph.version)
+        cached = self.result_cache.get(key)
+
+        header = [heading]
         header.append(f"Starting from: {format_vertex(start)}")
-        
-        if tree:
-            seq = [format_vertex(start)]
-            for u, v, w in tree:
-                seq.append(format_vertex(v))
-            header.append(f"Traversal order: {' → '.join(seq)}")
-        
-        if un:
-            un_labels = [format_vertex(i) for i in un]
-            header.append(f"⚠️ Unreachable nodes: {', '.join(un_labels)}")
-        
+        header.append(self.memory_summary(csr))
+        header.append(self.cache_summary(cached is not None))
         header.append("")
-        self.animate_edges(tree, header)
+
+        def finish(tree, counts):
+            lines = [""]
+            if tree:
+                seq = [format_vertex(start)]
+                for u, v, w in tree:
+                    seq.append(format_vertex(v))
+                lines.append(f"Traversal order: {' → '.join(seq)}")
+            if cached is not None:
+                un = cached[1]
+            else:
+                reached = [False] * csr.n
+                reached[start] = True
+                for u, v, w in tree:
+                    reached[v] = True
+                un = [i for i in range(csr.n) if not reached[i] and i not in csr.removed]
+                self.result_cache.put(key, (tree, un))
+            if un:
+                un_labels = [format_vertex(i) for i in un]
+                lines.append(f"⚠️ Unreachable nodes: {', '.join(un_labels)}")
+            self.result_panel.append("\n".join(lines))
+
+        events = replay_edges(cached[0]) if cached is not None else engine.trace(name, csr, start)
+        self.play_trace(events, header, finish)
+
+    def run_multi_bfs(self):
+        """BFS from every selected node at once; colour each node by its nearest seed."""
+        if not self.selected_nodes:
+            messagebox.showinfo("Multi-Source BFS",
+                                "Select the seed nodes first (Select & Pan, then drag a box\n"
+                                "or click nodes), then run Multi-Source BFS.", parent=self.root)
+            return
+        self._trace_token += 1
+        self.set_active_algorithm("msbfs")
+        seeds = sorted(self.selected_nodes)
+        csr = self.graph.freeze()
+        t0 = time.perf_counter()
+        (tree, dist, nearest), hit = self.cached(
+            ("msbfs", tuple(seeds)), lambda: engine.run("msbfs", csr, seeds))
+        elapsed = time.perf_counter() - t0
+
+        color_of = {s: self.region_palette[i % len(self.region_palette)]
+                    for i, s in enumerate(seeds)}
+        regions = {s: [] for s in seeds}
+        unreached = []
+        for v, s in enumerate(nearest):
+            if s >= 0:
+                regions[s].append(v)
+            elif v in self.node_items:
+                unreached.append(v)
+        forest = {s: [] for s in seeds}
+        for u, v, w in tree:
+            forest[nearest[v]].append((u, v))
+        script = [self.reset_edges_script(), self.reset_nodes_script(unreached)]
+        for s in seeds:
+            color = color_of[s]
+            script.append(self.config_script(self.node_circles(regions[s]),
+                                             fill=color, outline=color, width=3))
+            script.append(self.config_script(self.edge_lines(forest[s]), fill=color, width=3))
+        self.run_canvas_script(script)
+
+        lines = ["🌊 Multi-Source BFS"]
+        lines.append(f"Seeds: {', '.join(format_vertex(s) for s in seeds)}")
+        lines.append(f"Time: {elapsed * 1000:.1f} ms")
+        lines.append(self.cache_summary(hit))
+        lines.append("")
+        for s in seeds:
+            far = max(dist[v] for v in regions[s])
+            lines.append(f"{format_vertex(s)}: {len(regions[s])} nodes, farthest {far} hops")
+        if unreached:
+            lines.append(f"⚠️ Reached by no seed: {len(unreached)} nodes")
+        self.log("\n".join(lines), "Multi-BFS")
+
+    def run_components(self):
+        """Label every connected component and colour each in one canvas pass."""
+        if self.graph.num_nodes == 0:
+            messagebox.showwarning("Connected Components", "Graph is empty! Add nodes first.",
+                                   parent=self.root)
+            return
+        self._trace_token += 1
+        self.set_active_algorithm("components")
+        csr = self.graph.freeze()
+        t0 = time.perf_counter()
+        labels, hit = self.cached(("components",), lambda: engine.run("components", csr))
+        elapsed = time.perf_counter() - t0
+
+        members = [[] for _ in range(max(labels) + 1)]
+        for v, c in enumerate(labels):
+            if c >= 0:
+                members[c].append(v)
+        edges = [[] for _ in members]
+        for w, u, v in self.graph.edges:
+            edges[labels[u]].append((u, v))
+        palette = self.region_palette
+        script = []
+        for c, nodes in enumerate(members):
+            color = palette[c % len(palette)]
+            script.append(self.config_script(self.node_circles(nodes),
+                                             fill=color, outline=color, width=3))
+            script.append(self.config_script(self.edge_lines(edges[c]), fill=color, width=3))
+        self.run_canvas_script(script)
+
+        sizes = sorted((len(nodes) for nodes in members), reverse=True)
+        lines = ["🧩 Connected Components"]
+        lines.append(f"Components: {len(members)}")
+        lines.append(f"Sizes: {', '.join(map(str, sizes[:10]))}{' …' if len(sizes) > 10 else ''}")
+        lines.append(f"Time: {elapsed * 1000:.1f} ms")
+        lines.append(self.cache_summary(hit))
+        self.log("\n".join(lines), "Components")
 
     def run_prim(self, start):
-        mst, total = prim(self.graph, start)
-        
-        if mst is None:
-            messagebox.showinfo("Prim MST", "Graph is not connected!\nNo MST exists.", 
-                              parent=self.root)
-            self.log("⚠️ Prim MST: Graph not connected", "No MST")
+        if self.reject_disconnected("Prim MST"):
             return
-        
+        csr = self.graph.freeze()
         header = ["🌳 Prim's Minimum Spanning Tree"]
         header.append(f"Starting from: {format_vertex(start)}")
-        header.append(f"Total weight: {total}")
-        
-        if mst:
-            edge_desc = ", ".join(f"{format_vertex(u)}-{format_vertex(v)}" for (u, v, w) in mst)
-            header.append(f"Edges: {edge_desc}")
-        
-        header.append("")
-        self.animate_edges(mst, header)
+        header.append(self.memory_summary(csr))
+        self.play_mst(("prim", start), header, lambda: engine.trace("prim", csr, start))
 
     def run_kruskal(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("Kruskal MST", "Graph is empty! Add nodes first.", 
                                  parent=self.root)
             return
+        if self.reject_disconnected("Kruskal MST"):
+            return
+        csr = self.graph.freeze()
+        header = ["🔗 Kruskal's Minimum Spanning Tree"]
+        header.append(self.memory_summary(csr))
+        self.play_mst(("kruskal",), header, lambda: engine.trace("kruskal", csr))
+
+    def play_mst(self, key, header, make_trace):
+        """Play an MST trace, or replay the cached tree for this graph version."""
+        key = key + (self.graph.version,)
+        cached = self.result_cache.get(key)
+        header = header + [self.cache_summary(cached is not None), ""]
+
+        def finish(mst, counts):
+            total = sum(w for u, v, w in mst)
+            if cached is None:
+                self.result_cache.put(key, (mst, total))
+            lines = ["", f"Total weight: {total}"]
+            if mst:
+                edge_desc = ", ".join(f"{format_vertex(u)}-{format_vertex(v)}" for (u, v, w) in mst)
+                lines.append(f"Edges: {edge_desc}")
+            self.result_panel.append("\n".join(lines))
+
+        events = replay_edges(cached[0]) if cached is not None else make_trace()
+        self.play_trace(events, header, finish)
+
+    def run_boruvka(self):
+        self.run_global_mst("boruvka", "Borůvka MST", "🧩 Borůvka's Minimum Spanning Tree")
+
+    def toggle_live_mst(self):
+        if self.live_mst is not None:
+            self.live_mst = None
+            self.reset_edge_colors()
+            self.log("🌿 Live MST off", "Ready")
+            return
+        t0 = time.perf_counter()
+        self.live_mst = DynamicMST(self.graph)
+        self.reset_edge_colors()
+        self.update_live_mst(self.live_mst.edges(), [], time.perf_counter() - t0)
+
+    def update_live_mst(self, added, removed, elapsed=None):
+        """Restyle only the tree edges that changed and refresh the summary."""
+        for u, v, w in removed:
+            item = self.edge_items.get((u, v))
+            if item:
+                self.canvas.itemconfig(item[0], fill=self.edge_color, width=2)
+        for u, v, w in added:
+            item = self.edge_items.get((u, v))
+            if item:
+                self.canvas.itemconfig(item[0], fill=self.live_mst_color, width=3)
+        if elapsed is None:
+            return
+        mst = self.live_mst
+        lines = ["🌿 Live MST (updates on every edit)"]
+        lines.append(f"Total weight: {mst.total}")
+        lines.append(f"Tree edges: {mst.size} / {max(mst.nodes - 1, 0)}")
+        if not mst.is_spanning_tree():
+            lines.append("⚠️ Graph not connected: showing a spanning forest")
+        lines.append(f"Last update: {elapsed * 1000:.3f} ms")
+        self.log("\n".join(lines), "Live MST")
+
+    def run_global_mst(self, algorithm, title, heading):
+        if self.graph.num_nodes == 0:
+            messagebox.showwarning(title, "Graph is empty! Add nodes first.", 
+                                 parent=self.root)
+            return
+        if self.reject_disconnected(title):
+            return
         
-        mst, total = kruskal(self.graph)
+        csr = self.graph.freeze()
+        t0 = time.perf_counter()
+        (mst, total), hit = self.cached((algorithm,), lambda: engine.run(algorithm, csr))
+        elapsed = time.perf_counter() - t0
         
         if mst is None:
-            messagebox.showinfo("Kruskal MST", "Graph is not connected!\nNo MST exists.", 
+            messagebox.showinfo(title, "Graph is not connected!\nNo MST exists.", 
                               parent=self.root)
-            self.log("⚠️ Kruskal MST: Graph not connected", "No MST")
+            self.log(f"⚠️ {title}: Graph not connected", "No MST")
             return
         
-        header = ["🔗 Kruskal's Minimum Spanning Tree"]
+        header = [heading]
         header.append(f"Total weight: {total}")
+        header.append(f"Time: {elapsed * 1000:.1f} ms")
         
         if mst:
             edge_desc = ", ".join(f"{format_vertex(u)}-{format_vertex(v)}" for (u, v, w) in mst)
             header.append(f"Edges: {edge_desc}")
         
+        header.append(self.memory_summary(csr))
+        header.append(self.cache_summary(hit))
         header.append("")
         self.reset_node_colors()
         self.animate_edges(mst, header)
 
-    def run_dijkstra(self, src, dest):
-        dist, path = dijkstra(self.graph, src, dest)
-        
+    def cached(self, key, compute):
+        """Result of compute() for key at the current graph version, memoized."""
+        full_key = key + (self.graph.version,)
+        value = self.result_cache.get(full_key)
+        if value is not None:
+            return value, True
+        value = compute()
+        self.result_cache.put(full_key, value)
+        return value, False
+
+    def cache_summary(self, hit):
+        c = self.result_cache
+        return (f"Cache: {'hit' if hit else 'miss'} "
+                f"({c.hits}/{c.hits + c.misses} hits, {c.hit_rate():.0%})")
+
+    def reject_disconnected(self, title):
+        """Refuse an MST run up front when the component index says it must fail."""
+        count = self.graph.component_count()
+        if count <= 1:
+            return False
+        messagebox.showinfo(title, f"Graph is not connected ({count} components)!\nNo MST exists.",
+                            parent=self.root)
+        self.log(f"⚠️ {title}: Graph not connected ({count} components)", "No MST")
+        return True
+
+    def run_path_query(self, src, dest):
+        if not self.graph.connected(src, dest):
+            messagebox.showinfo("Dijkstra",
+                                f"No path exists from {format_vertex(src)} to {format_vertex(dest)}\n"
+                                "(they are in different components)",
+                                parent=self.root)
+            self.log("⚠️ No path: nodes are in different components", "No path")
+            return
+        if self.path_algorithm == "astar":
+            self.run_astar(src, dest)
+        elif self.path_algorithm == "alt":
+            self.run_alt(src, dest)
+        elif self.path_algorithm == "ch":
+            self.run_ch(src, dest)
+        else:
+            self.run_dijkstra(src, dest, self.path_algorithm == "bidijkstra")
+
+    def run_dijkstra(self, src, dest, bidirectional=False):
+        csr = self.graph.freeze()
+        if not bidirectional:
+            self.run_tree_query(src, dest, csr)
+            return
+
+        def compute():
+            stats = {}
+            dist, path = engine.run("bidijkstra", csr, src, dest, stats)
+            return dist, path, stats
+
+        (dist, path, stats), hit = self.cached(("bidijkstra", src, dest), compute)
+        extra = [f"Settled nodes: {stats['settled']}", self.cache_summary(hit)]
+        self.show_path("Bidirectional Dijkstra", src, dest, dist, path, csr, extra)
+
+    def run_tree_query(self, src, dest, csr):
+        """One-to-many Dijkstra: reuse (and extend) the search tree of src."""
+        tree = self.path_trees.get(src)
+        if tree is None or not tree.is_valid_for(csr):
+            tree = ShortestPathTree(csr, src)
+            self.path_trees.put(src, tree)
+        title = "Dijkstra's Shortest Path"
+        # an already settled dest is a cache hit, like a stored bidijkstra result
+        if tree.done[dest]:
+            self.result_cache.hits += 1
+            dist, path = tree.query(dest)
+            extra = [f"Settled nodes: {tree.settled} (answered from the existing tree)",
+                     f"Priority queue: {tree.queue.name} (resumable)",
+                     self.cache_summary(True)]
+            self.show_path(title, src, dest, dist, path, csr, extra)
+            return
+
+        self.result_cache.misses += 1
+        before = tree.settled
+        header = [f"🎯 {title}"]
+        header.append(f"Searching: {format_vertex(src)} → {format_vertex(dest)}")
+        header.append("")
+
+        def finish(accepted, counts):
+            dist, path = tree.query(dest)
+            extra = [f"Settled nodes: {tree.settled} "
+                     f"(resumed search, {tree.settled - before} newly settled)",
+                     f"Priority queue: {tree.queue.name} (resumable)",
+                     self.cache_summary(False),
+                     self.trace_summary(counts)]
+            self.show_path(title, src, dest, dist, path, csr, extra)
+
+        self.play_trace(tree.trace(dest), header, finish, key_label="dist",
+                        step_accepts=False)
+
+    def run_astar(self, src, dest):
+        csr = self.graph.freeze()
+        if self.astar_scale is None or self.astar_scale[0] is not csr:
+            self.astar_scale = (csr, euclidean_scale(csr, self.node_positions))
+        scale = self.astar_scale[1]
+        stats = {}
+        dist, path = engine.run("astar", csr, src, dest, self.node_positions, scale, stats)
+
+        def baseline():
+            base = {}
+            engine.run("dijkstra", csr, src, dest, stats=base)
+            return base["settled"]
+
+        base_settled, _ = self.cached(("dijkstra-settled", src, dest), baseline)
+        self.show_path("A* Search", src, dest, dist, path, csr, [
+            f"Expanded nodes: {stats['settled']} (Dijkstra: {base_settled})",
+            f"Heuristic: {scale:.4g} × straight-line distance",
+        ])
+
+    def run_alt(self, src, dest):
+        csr = self.graph.freeze()
+        extra = []
+        if self.landmarks is None or not self.landmarks.is_valid_for(csr):
+            t0 = time.perf_counter()
+            self.landmarks = engine.prepare("alt", csr, self.landmark_count)
+            extra.append(f"Preprocessing: {(time.perf_counter() - t0) * 1000:.1f} ms")
+        stats = {}
+        dist, path = engine.run("alt", self.landmarks, src, dest, stats)
+        landmark_labels = ", ".join(format_vertex(u) for u in self.landmarks.landmarks)
+        extra.insert(0, f"Landmarks ({len(self.landmarks.landmarks)}): {landmark_labels}")
+        extra.append(f"Settled nodes: {stats['settled']}")
+        self.show_path("ALT Landmark Search", src, dest, dist, path, csr, extra)
+
+    def run_ch(self, src, dest):
+        csr = self.graph.freeze()
+        if self.hierarchy is None or not self.hierarchy.is_valid_for(csr):
+            self.log("Building contraction hierarchy…", "Preprocessing")
+            self.root.update_idletasks()
+            self.hierarchy = engine.prepare("ch", csr)
+        ch = self.hierarchy
+        stats = {}
+        t0 = time.perf_counter()
+        dist, path = engine.run("ch", ch, src, dest, stats)
+        elapsed = time.perf_counter() - t0
+        self.show_path("Contraction Hierarchy", src, dest, dist, path, csr, [
+            f"Query: {elapsed * 1000:.3f} ms, settled {stats['settled']} nodes",
+            f"Preprocessing: {ch.preprocess_seconds * 1000:.1f} ms, "
+            f"{ch.num_shortcuts} shortcuts ({ch.num_up_edges} upward edges)",
+        ])
+
+    def show_path(self, title, src, dest, dist, path, csr, extra_lines=()):
         if dist == math.inf:
-            messagebox.showinfo("Dijkstra", 
+            messagebox.showinfo(title, 
                               f"No path exists from {format_vertex(src)} to {format_vertex(dest)}", 
                               parent=self.root)
-            self.log("⚠️ Dijkstra: No path found", "No path")
+            self.log(f"⚠️ {title}: No path found", "No path")
             return
 
         edges = []
         for i in range(len(path) - 1):
             u, v = path[i], path[i + 1]
-            w = None
-            for to, ww in self.graph.adj[u]:
-                if to == v:
-                    w = ww
-                    break
+            w = self.graph.weight(u, v)
             if w is None:
                 continue
             edges.append((u, v, w))
 
-        header = ["🎯 Dijkstra's Shortest Path"]
+        header = [f"🎯 {title}"]
         header.append(f"From: {format_vertex(src)} → To: {format_vertex(dest)}")
         header.append(f"Total distance: {dist}")
         header.append(f"Path: {' → '.join(format_vertex(v) for v in path)}")
+        header.extend(extra_lines)
+        header.append(self.memory_summary(csr))
         header.append("")
 
         self.reset_node_colors()
@@ -1816,6 +2125,7 @@ Ready to create your graph!"""
 
 # ---------- Main Entry Point ----------
 def main():
+    multiprocessing.freeze_support()  # Borůvka workers in the packaged .exe
     root = tk.Tk()
     root.geometry("1400x850")
     root.minsize(1000, 600)
@@ -0,0 +1,48 @@
+"""Settled nodes and time: one-way against bidirectional Dijkstra.
+
+On a seeded grid and a seeded random geometric graph, runs dijkstra and
+bidijkstra for the same random source/destination pairs, checks that the
+distances agree, and prints the average settled-node count and time.
+
+    python benchmarks/bench_bidijkstra.py [nodes] [pairs] [seed]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+
+def average(csr, name, pairs):
+    settled = seconds = 0
+    dists = []
+    for src, dest in pairs:
+        stats = {}
+        t0 = time.perf_counter()
+        dist, _ = engine.run(name, csr, src, dest, stats=stats)
+        seconds += time.perf_counter() - t0
+        settled += stats["settled"]
+        dists.append(dist)
+    return settled / len(pairs), seconds / len(pairs) * 1000, dists
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 40_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    for family in ("grid", "geometric"):
+        csr = engine.generate(family, n, seed=seed)[0].freeze()
+        rng = random.Random(seed)
+        pairs = [(rng.randrange(csr.n), rng.randrange(csr.n)) for _ in range(count)]
+        uni, t_uni, d_uni = average(csr, "dijkstra", pairs)
+        bi, t_bi, d_bi = average(csr, "bidijkstra", pairs)
+        print(f"{family:>9}: {csr.n:,} nodes {csr.num_edges:,} edges, {count} pairs  "
+              f"dijkstra {uni:9.0f} settled {t_uni:7.1f} ms  "
+              f"bidijkstra {bi:9.0f} settled {t_bi:7.1f} ms  "
+              f"({uni / bi:.2f}x fewer)  {'ok' if d_uni == d_bi else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
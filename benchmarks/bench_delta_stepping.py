@@ -0,0 +1,37 @@
+"""Scaling benchmark for delta_stepping() across worker counts.
+
+Runs a full single-source computation on a seeded 2D grid and G(n, m) graph
+from engine.generate for 1..N workers (N = os.cpu_count() unless given) and
+prints wall time next to plain Dijkstra.
+
+    python benchmarks/bench_delta_stepping.py [max_workers] [delta]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+
+def generated(family, n, seed, **params):
+    return engine.generate(family, n, seed=seed, **params)[0].freeze()
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    delta = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    cases = [("grid 400x400", generated("grid", 400 * 400, 1)),
+             ("random 100k/500k", generated("er", 100_000, 2, m=500_000))]
+    for name, g in cases:
+        t0 = time.perf_counter()
+        engine.dijkstra(g, 0, -1, queue="heapq")
+        print(f"{name}: dijkstra {time.perf_counter() - t0:.2f} s")
+        for workers in range(1, max_workers + 1):
+            t0 = time.perf_counter()
+            engine.delta_stepping(g, 0, delta=delta, workers=workers)
+            print(f"{name}: delta-stepping x{workers} {time.perf_counter() - t0:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
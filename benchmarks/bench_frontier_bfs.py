@@ -0,0 +1,51 @@
+"""Frontier-at-a-time NumPy BFS against the deque BFS on ~1e6-edge graphs.
+
+For each generated family it times bfs_spanning_tree (deque), bfs_levels
+(NumPy arrays only) and frontier_bfs_spanning_tree (same tree-edge list as
+the deque version), checks that both trees reach the same nodes at the
+same depths, and prints the speedups.
+
+    python benchmarks/bench_frontier_bfs.py [edges] [seed]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+
+def best(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, min(times)
+
+
+def depths(tree, start):
+    depth = {start: 0}
+    for u, v, _ in tree:
+        depth[v] = depth[u] + 1
+    return depth
+
+
+def main():
+    m = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    cases = [("er", m // 4, {"m": m}), ("ba", m // 4, {"m": 4}), ("grid", m // 2, {}),
+             ("geometric", m // 4, {}), ("knn", m // 3, {"k": 4})]
+    for family, n, params in cases:
+        csr = engine.generate(family, n, seed=seed, **params)[0].freeze()
+        (tree, unreach), t_deque = best(lambda: engine.bfs_spanning_tree(csr, 0))
+        _, t_levels = best(lambda: engine.bfs_levels(csr, 0))
+        (ftree, funreach), t_tree = best(lambda: engine.frontier_bfs_spanning_tree(csr, 0))
+        ok = funreach == unreach and depths(ftree, 0) == depths(tree, 0)
+        print(f"{family:>9}: {csr.n:>8,} nodes {csr.num_edges:>9,} edges  "
+              f"deque {t_deque:6.3f} s  levels {t_levels:6.3f} s ({t_deque / t_levels:4.1f}x)  "
+              f"tree {t_tree:6.3f} s ({t_deque / t_tree:4.1f}x)  {'ok' if ok else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
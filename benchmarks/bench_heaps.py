@@ -0,0 +1,44 @@
+"""Compare the heapq (lazy deletion) and indexed d-ary heap queues.
+
+Runs full-graph Dijkstra (dest = -1, so nothing stops early) and Prim on a
+sparse and a dense seeded G(n, m) graph from engine.generate and prints wall
+time and peak queue size.
+
+    python benchmarks/bench_heaps.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+
+def random_graph(n, m, seed):
+    return engine.generate("er", n, seed=seed, m=m, max_weight=1000)[0].freeze()
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    cases = [
+        ("sparse", random_graph(100_000, 400_000, 1)),
+        ("dense", random_graph(2_000, 800_000, 2)),
+    ]
+    print(f"{'graph':8} {'algorithm':9} {'queue':6} {'time (s)':>9} {'max queue':>10}")
+    for name, g in cases:
+        for queue in ("heapq", "dary"):
+            stats = {}
+            t = timed(lambda: engine.dijkstra(g, 0, -1, stats=stats, queue=queue))
+            print(f"{name:8} {'dijkstra':9} {queue:6} {t:9.3f} {stats['max_queue']:10d}")
+        for queue in ("heapq", "dary"):
+            t = timed(lambda: engine.prim(g, 0, queue=queue))
+            print(f"{name:8} {'prim':9} {queue:6} {t:9.3f} {'':>10}")
+
+
+if __name__ == "__main__":
+    main()
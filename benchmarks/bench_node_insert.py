@@ -0,0 +1,78 @@
+"""Sequential node insertion: in-place growth against the old copy-on-insert.
+
+Times N calls to Graph.add_node() (alone, and with DynamicMST following
+along as in the editor) and one Graph.add_nodes(N) call.  Then, on a
+smaller N where it is already quadratic, compares the old approach of
+building a new Graph(n + 1) and copying every adjacency entry and edge per
+insert; there each new node is joined to a random earlier one so the
+copies have edges to carry.
+
+    python benchmarks/bench_node_insert.py [nodes] [old_nodes] [seed]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+
+def grow_in_place(n, rng=None):
+    g = engine.Graph(0)
+    mst = engine.DynamicMST(g)
+    for _ in range(n):
+        v = g.add_node()
+        mst.add_node()
+        if v and rng:
+            u = rng.randrange(v)
+            g.add_edge(u, v, 1)
+            mst.insert(u, v, 1)
+    return g
+
+
+def grow_by_copy(n, rng):
+    """What GraphGUI.add_node used to do."""
+    g = engine.Graph(0)
+    for idx in range(n):
+        new_g = engine.Graph(idx + 1)
+        for u in range(g.n):
+            for v, w in g.adj[u]:
+                new_g.adj[u].append((v, w))
+        new_g.edges = list(g.edges)
+        new_g.edge_index = g.edge_index
+        new_g.components = g.components
+        new_g.components.add_node()
+        g = new_g
+        if idx:
+            g.add_edge(rng.randrange(idx), idx, 1)
+    return g
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 100_000
+    old_n = int(float(sys.argv[2])) if len(sys.argv) > 2 else 2_000
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    _, t = timed(lambda: engine.Graph(0).add_nodes(n))
+    print(f"add_nodes({n:,})           {t:8.4f} s")
+    g = engine.Graph(0)
+    _, t = timed(lambda: [g.add_node() for _ in range(n)])
+    print(f"{n:,} x add_node()         {t:8.4f} s  ({t / n * 1e6:.2f} us each)")
+    g, t = timed(lambda: grow_in_place(n))
+    print(f"{n:,} x add_node + MST     {t:8.4f} s  ({g.component_count():,} components)")
+
+    _, t_old = timed(lambda: grow_by_copy(old_n, random.Random(seed)))
+    _, t_new = timed(lambda: grow_in_place(old_n, random.Random(seed)))
+    print(f"{old_n:,} inserts, each with an edge: copy {t_old:.3f} s, in place {t_new:.4f} s "
+          f"({t_old / t_new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""Benchmark suite: every registered algorithm over a ladder of graph sizes.
+
+For each graph family (random, grid, chain) and each size on the ladder
+(1e2 .. 1e6 edges, capped by --max-edges) it records, per algorithm:
+
+  seconds     best wall time over --repeat runs (runs over 1 s are not repeated)
+  peak_bytes  tracemalloc peak of one extra run (this process only, so the
+              process-pool backends report the parent's share)
+  counts      step-event counts from the algorithm's trace, the stats dict
+              it fills in (settled nodes etc.), or a digest of its result
+
+ALT and CH get a separate "<name>.prepare" row for preprocessing.  Results
+go to --output as JSON, together with the time of a fixed calibration
+workload (the slower of one run before and one after the suite).  With
+--baseline, every row that also appears in the baseline is compared and
+the script exits with status 1 on a regression:
+
+  counts      must match exactly (they do not depend on the machine)
+  peak_bytes  may grow by --tolerance
+  seconds     is first rescaled by the ratio of the two calibration times,
+              then may grow by the much looser --time-tolerance (3x by
+              default); wall times on a shared machine swing by 2x between
+              identical runs, so this only catches gross slowdowns
+
+    python benchmarks/bench_suite.py --max-edges 1e5 --baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --update-baseline      # re-record the baseline
+"""
+import argparse
+import heapq
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import graph_engine as engine  # noqa: E402
+
+LADDER = (100, 1_000, 10_000, 100_000, 1_000_000)
+# preprocessing-heavy algorithms stop earlier on the ladder; CH finds no
+# hierarchy in random graphs, where shortcuts pile up almost quadratically
+MAX_EDGES = {"alt": 100_000, "ch": 10_000, ("random", "ch"): 1_000}
+TIME_FLOOR = 0.005       # seconds; smaller differences are noise
+CALIBRATION_ITEMS = 50_000
+MEMORY_FLOOR = 64 * 1024  # bytes
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+# ---------- Graph families (seeded) ----------
+def random_family(m, seed):
+    """Connected random graph with m edges and about m / 4 nodes."""
+    rng = random.Random(seed)
+    n = max(2, m // 4)
+    edges = [(rng.randrange(v), v, rng.randint(1, 100)) for v in range(1, n)]
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(1, 100)))
+    return engine.Graph.from_edges(n, edges), None
+
+
+def grid_family(m, seed):
+    """k x k grid with about m edges; positions are the grid coordinates."""
+    rng = random.Random(seed)
+    k = max(2, round(math.sqrt(m / 2)))
+    edges = []
+    for r in range(k):
+        for c in range(k):
+            u = r * k + c
+            if c + 1 < k:
+                edges.append((u, u + 1, rng.randint(1, 100)))
+            if r + 1 < k:
+                edges.append((u, u + k, rng.randint(1, 100)))
+    positions = [(float(c), float(r)) for r in range(k) for c in range(k)]
+    return engine.Graph.from_edges(k * k, edges), positions
+
+
+def chain_family(m, seed):
+    """A single path of m edges: the deepest DFS and the widest Dijkstra sweep."""
+    rng = random.Random(seed)
+    edges = [(v - 1, v, rng.randint(1, 100)) for v in range(1, m + 1)]
+    positions = [(float(v), 0.0) for v in range(m + 1)]
+    return engine.Graph.from_edges(m + 1, edges), positions
+
+
+FAMILIES = {"random": random_family, "grid": grid_family, "chain": chain_family}
+
+
+# ---------- Measuring ----------
+def best_time(fn, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        if elapsed > 1.0:
+            break
+    return best
+
+
+def calibrate(repeat=5):
+    """Seconds for a fixed pure-Python heap/dict workload: this machine's speed."""
+    def work():
+        heap, seen = [], {}
+        for i in range(CALIBRATION_ITEMS):
+            k = i * 7919 % 100_003
+            heapq.heappush(heap, (k, i))
+            seen[k] = i
+        while heap:
+            heapq.heappop(heap)
+    return best_time(work, repeat)
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _tree_digest(result):
+    tree, unreachable = result
+    return {"tree_edges": len(tree), "unreachable": len(unreachable)}
+
+
+def _mst_digest(result):
+    mst, total = result
+    return {"tree_edges": len(mst or []), "total": total if mst is not None else None}
+
+
+def _seeds_digest(result):
+    tree, dist, nearest = result
+    return {"tree_edges": len(tree), "reached": sum(1 for d in dist if d >= 0),
+            "max_hops": max(dist, default=-1)}
+
+
+def _distance_digest(result):
+    dist, _ = result
+    reached = [d for d in dist if d != math.inf]
+    return {"reached": len(reached), "dist_sum": sum(reached)}
+
+
+# counts for rows with no trace or stats, taken from the result itself
+RESULT_DIGESTS = {
+    "frontier": _tree_digest,
+    "msbfs": _seeds_digest,
+    "delta": _distance_digest,
+    "boruvka": _mst_digest,
+    "components": lambda labels: {"components": max(labels, default=-1) + 1},
+    "alt.prepare": lambda index: {"landmarks": len(index.landmarks)},
+    "ch.prepare": lambda index: {"shortcuts": index.num_shortcuts},
+}
+
+
+def digest(name, fn):
+    summarize = RESULT_DIGESTS.get(name)
+    return (lambda: summarize(fn())) if summarize else None
+
+
+def cases(csr, positions, include):
+    """(row name, callable, counts callable) for every algorithm that applies."""
+    src, dest = 0, csr.n - 1
+    for alg in engine.ALGORITHMS.values():
+        name = alg.name
+        if not include(name):
+            continue
+        if alg.kind == "source":
+            fn = (lambda a=name: engine.run(a, csr, src))
+            counts = (lambda a=name: engine.trace_counts(engine.trace(a, csr, src))) if alg.trace else None
+            yield name, fn, counts or digest(name, fn)
+        elif alg.kind == "seeds":
+            fn = (lambda a=name: engine.run(a, csr, (src, dest)))
+            yield name, fn, digest(name, fn)
+        elif alg.kind == "global":
+            fn = (lambda a=name: engine.run(a, csr))
+            counts = (lambda a=name: engine.trace_counts(engine.trace(a, csr))) if alg.trace else None
+            yield name, fn, counts or digest(name, fn)
+        elif alg.index:
+            fn = (lambda a=name: engine.prepare(a, csr))
+            yield name + ".prepare", fn, digest(name + ".prepare", fn)
+            index = engine.prepare(name, csr)
+            yield name, (lambda a=name: engine.run(a, index, src, dest)), \
+                (lambda a=name: stats_of(lambda st: engine.run(a, index, src, dest, st)))
+        elif name == "astar":
+            if positions is None:
+                continue
+            scale = engine.euclidean_scale(csr, positions)
+            yield name, (lambda: engine.run("astar", csr, src, dest, positions, scale)), \
+                (lambda: stats_of(lambda st: engine.run("astar", csr, src, dest, positions, scale, st)))
+        else:
+            yield name, (lambda a=name: engine.run(a, csr, src, dest)), \
+                (lambda a=name: stats_of(lambda st: engine.run(a, csr, src, dest, stats=st)))
+
+
+def stats_of(call):
+    stats = {}
+    call(stats)
+    return {k: v for k, v in stats.items() if isinstance(v, (int, float))}
+
+
+def run_suite(args):
+    rows = []
+    wanted = set(args.algorithms.split(",")) if args.algorithms else None
+    for family in args.families.split(","):
+        for size in LADDER:
+            if size > args.max_edges:
+                break
+            graph, positions = FAMILIES[family](size, args.seed)
+            csr = graph.freeze()
+
+            def include(name):
+                cap = MAX_EDGES.get((family, name), MAX_EDGES.get(name, math.inf))
+                return (not wanted or name in wanted) and size <= cap
+
+            for name, fn, counts in cases(csr, positions, include):
+                row = {
+                    "family": family,
+                    "size": size,
+                    "nodes": csr.n,
+                    "edges": csr.num_edges,
+                    "algorithm": name,
+                    "seconds": best_time(fn, args.repeat),
+                    "peak_bytes": peak_memory(fn),
+                    "counts": counts() if counts else {},
+                }
+                rows.append(row)
+                print(f"{family:>7} {size:>9,} {name:<18} {row['seconds'] * 1000:10.2f} ms "
+                      f"{row['peak_bytes'] / 1e6:9.2f} MB", flush=True)
+    return rows
+
+
+def compare(rows, baseline, tolerance, time_tolerance, calibration):
+    """Return a list of human-readable regressions against the baseline rows."""
+    known = {(r["family"], r["size"], r["algorithm"]): r for r in baseline["results"]}
+    # baseline times as they would be on this machine
+    speed = calibration / baseline["meta"].get("calibration_seconds", calibration)
+    problems = []
+    for row in rows:
+        old = known.get((row["family"], row["size"], row["algorithm"]))
+        if old is None:
+            continue
+        where = f"{row['family']} {row['size']:,} {row['algorithm']}"
+        expected = old["seconds"] * speed
+        if (row["seconds"] > expected * (1 + time_tolerance)
+                and row["seconds"] - expected > TIME_FLOOR):
+            problems.append(f"{where}: time {expected * 1000:.2f} (calibrated) -> "
+                            f"{row['seconds'] * 1000:.2f} ms")
+        if (row["peak_bytes"] > old["peak_bytes"] * (1 + tolerance)
+                and row["peak_bytes"] - old["peak_bytes"] > MEMORY_FLOOR):
+            problems.append(f"{where}: peak memory {old['peak_bytes']:,} -> "
+                            f"{row['peak_bytes']:,} bytes")
+        if old["counts"] and row["counts"] != old["counts"]:
+            problems.append(f"{where}: operation counts changed "
+                            f"{old['counts']} -> {row['counts']}")
+    return problems
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("--max-edges", type=float, default=1e6)
+    p.add_argument("--families", default=",".join(FAMILIES))
+    p.add_argument("--algorithms", help="comma-separated registry names (default: all)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--output", default="bench_results.json")
+    p.add_argument("--baseline", help="compare against this results file")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed relative memory growth (default 0.25)")
+    p.add_argument("--time-tolerance", type=float, default=2.0,
+                   help="allowed relative slowdown after calibration (default 2.0, i.e. 3x)")
+    p.add_argument("--update-baseline", action="store_true",
+                   help=f"write the results to {os.path.relpath(DEFAULT_BASELINE)} as well")
+    args = p.parse_args()
+
+    calibration = calibrate()
+    rows = run_suite(args)
+    calibration = max(calibration, calibrate())  # the machine may have slowed mid-run
+    print(f"calibration: {calibration * 1000:.1f} ms")
+    results = {
+        "meta": {
+            "calibration_seconds": calibration,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": rows,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    print(f"wrote {len(rows)} rows to {args.output}")
+    if args.update_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+        print(f"baseline updated: {DEFAULT_BASELINE}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(rows, baseline, args.tolerance, args.time_tolerance, calibration)
+        if problems:
+            print(f"\n!!! {len(problems)} REGRESSION(S) against {args.baseline} !!!",
+                  file=sys.stderr)
+            for line in problems:
+                print("  " + line, file=sys.stderr)
+            return 1
+        print(f"no regressions against {args.baseline} (counts exact, memory "
+              f"+{args.tolerance:.0%}, calibrated time +{args.time_tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Run graph algorithms on a saved .json graph without the GUI.
+
+    python graph_cli.py graph.json dijkstra --source 1 --dest 7
+    python graph_cli.py graph.json ch --pairs pairs.txt --repeat 5 -o out.jsonl
+    python graph_cli.py graph.json kruskal --counts
+    python graph_cli.py gen:er:n=250000,m=1000000,seed=7 bfs --source 1
+    python graph_cli.py gen:grid:n=10000,seed=1 --save grid.json
+
+Instead of a file, "gen:<family>:key=value,..." generates a seeded graph
+(families: er, grid, geometric, ba, knn; needs NumPy); --save writes the
+graph as .json, and the algorithm may then be left out.
+Vertices are given and reported with the GUI's labels (1, 2, 3, ...).
+Every query becomes one JSON line on stdout (or --output).  A pairs file
+holds one "source dest" pair per line; blank lines and # comments are
+skipped.  Never imports tkinter.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+
+from graph_engine import (
+    INDEX_BASE, format_vertex, load_graph_file, graph_to_json, trace_counts, euclidean_scale,
+    get_algorithm, algorithm_names, run, prepare, trace,
+)
+
+GENERATED = "gen:"
+
+
+def parse_vertex(tok, n):
+    tok = tok.strip()
+    if not tok.isdigit() or not 0 <= int(tok) - INDEX_BASE < n:
+        raise ValueError(f"unknown vertex {tok!r} (graph has {n} nodes)")
+    return int(tok) - INDEX_BASE
+
+
+def read_pairs(path, n):
+    pairs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            src, dest = line.replace(",", " ").split()
+            pairs.append((parse_vertex(src, n), parse_vertex(dest, n)))
+    return pairs
+
+
+def load_graph(spec):
+    """(Graph, positions) from a .json path or a "gen:family:key=value,..." spec."""
+    if not spec.startswith(GENERATED):
+        return load_graph_file(spec)
+    from graph_engine import generate, parse_spec
+    family, params = parse_spec(spec[len(GENERATED):])
+    if "n" not in params:
+        raise ValueError("the node count n=... is required")
+    return generate(family, **params)
+
+
+def timed(fn, repeat):
+    """fn() run `repeat` times; returns (last result, best seconds, mean seconds)."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t0)
+    return result, min(times), sum(times) / len(times)
+
+
+def number(x):
+    return None if x == math.inf else x
+
+
+def labelled_edges(edges):
+    return [[format_vertex(u), format_vertex(v), w] for u, v, w in edges]
+
+
+def path_query(args, csr, positions):
+    """Returns query(src, dest, stats) -> (dist, path) plus a record of setup work."""
+    alg = get_algorithm(args.algorithm)
+    fn = alg.load()
+    setup = {}
+    if alg.index:
+        t0 = time.perf_counter()
+        extra = (args.landmarks,) if alg.name == "alt" else ()
+        index = prepare(alg.name, csr, *extra)
+        setup["preprocess_seconds"] = time.perf_counter() - t0
+        if alg.name == "alt":
+            setup["landmarks"] = len(index.landmarks)
+        elif alg.name == "ch":
+            setup["shortcuts"] = index.num_shortcuts
+        return lambda s, t, st: fn(index, s, t, st), setup
+    if alg.name == "astar":
+        if len(positions) != csr.n:
+            raise ValueError("astar needs node positions in the graph file")
+        scale = euclidean_scale(csr, positions)
+        return lambda s, t, st: fn(csr, s, t, positions, scale, st), setup
+    if alg.name == "dijkstra":
+        return lambda s, t, st: fn(csr, s, t, stats=st, queue=args.queue), setup
+    return lambda s, t, st: fn(csr, s, t, st), setup
+
+
+def run_paths(args, csr, positions, pairs, emit):
+    query, setup = path_query(args, csr, positions)
+    for src, dest in pairs:
+        stats = {}
+        (dist, path), best, mean = timed(lambda: query(src, dest, stats), args.repeat)
+        record = {
+            "algorithm": args.algorithm,
+            "source": format_vertex(src),
+            "dest": format_vertex(dest),
+            "dist": number(dist),
+            "path": [format_vertex(v) for v in path],
+            "seconds": best,
+            "mean_seconds": mean,
+            "repeat": args.repeat,
+            "stats": stats,
+        }
+        record.update(setup)
+        if args.counts and get_algorithm(args.algorithm).trace:
+            record["counts"] = trace_counts(trace(args.algorithm, csr, src, dest))
+        emit(record)
+
+
+def run_source(args, csr, sources, emit):
+    for src in sources:
+        record = {"algorithm": args.algorithm, "source": format_vertex(src)}
+        if args.algorithm in ("dfs", "bfs", "frontier"):
+            (tree, un), best, mean = timed(lambda: run(args.algorithm, csr, src), args.repeat)
+            record["edges"] = labelled_edges(tree)
+            record["unreachable"] = [format_vertex(v) for v in un]
+        elif args.algorithm == "prim":
+            (mst, total), best, mean = timed(lambda: run("prim", csr, src, args.queue_prim),
+                                             args.repeat)
+            record["total"] = number(total)
+            record["edges"] = labelled_edges(mst or [])
+        else:
+            (dist, parent), best, mean = timed(
+                lambda: run("delta", csr, src, args.delta, args.workers), args.repeat)
+            record["dist"] = [number(d) for d in dist]
+        record.update(seconds=best, mean_seconds=mean, repeat=args.repeat)
+        if args.counts and get_algorithm(args.algorithm).trace:
+            record["counts"] = trace_counts(trace(args.algorithm, csr, src))
+        emit(record)
+
+
+def run_seeds(args, csr, seeds, emit):
+    (tree, dist, nearest), best, mean = timed(lambda: run(args.algorithm, csr, seeds),
+                                              args.repeat)
+    emit({
+        "algorithm": args.algorithm,
+        "seeds": [format_vertex(s) for s in seeds],
+        "dist": [d if d >= 0 else None for d in dist],
+        "nearest": [format_vertex(s) if s >= 0 else None for s in nearest],
+        "edges": labelled_edges(tree),
+        "seconds": best,
+        "mean_seconds": mean,
+        "repeat": args.repeat,
+    })
+
+
+def run_components(args, csr, emit):
+    labels, best, mean = timed(lambda: run("components", csr), args.repeat)
+    emit({
+        "algorithm": "components",
+        "count": max(labels) + 1 if labels else 0,
+        "labels": labels.tolist(),
+        "seconds": best,
+        "mean_seconds": mean,
+        "repeat": args.repeat,
+    })
+
+
+def run_global(args, csr, emit):
+    if args.algorithm == "components":
+        return run_components(args, csr, emit)
+    if args.algorithm == "boruvka":
+        fn = lambda: run("boruvka", csr, args.workers)
+    else:
+        fn = lambda: run(args.algorithm, csr)
+    (mst, total), best, mean = timed(fn, args.repeat)
+    record = {
+        "algorithm": args.algorithm,
+        "total": number(total),
+        "edges": labelled_edges(mst or []),
+        "seconds": best,
+        "mean_seconds": mean,
+        "repeat": args.repeat,
+    }
+    if args.counts and get_algorithm(args.algorithm).trace:
+        record["counts"] = trace_counts(trace(args.algorithm, csr))
+    emit(record)
+
+
+def build_parser():
+    p = argparse.ArgumentParser(description="Run graph algorithms on a saved graph.")
+    p.add_argument("graph", help="graph file written by the GUI's Save As, "
+                                 "or gen:<family>:n=...,seed=... to generate one")
+    p.add_argument("algorithm", nargs="?", choices=algorithm_names())
+    p.add_argument("--save", help="write the (generated) graph to this .json file")
+    p.add_argument("--source", "-s", action="append", default=[],
+                   help="start vertex (repeatable; msbfs starts from all of them at once)")
+    p.add_argument("--dest", "-t", help="target vertex for path algorithms")
+    p.add_argument("--pairs", help="file of 'source dest' lines for path algorithms")
+    p.add_argument("--repeat", "-r", type=int, default=1,
+                   help="run each query N times and report best and mean time")
+    p.add_argument("--output", "-o", help="write JSON lines here instead of stdout")
+    p.add_argument("--counts", action="store_true",
+                   help="add step-event counts (dfs, bfs, dijkstra, prim, kruskal)")
+    p.add_argument("--queue", default="auto", choices=("auto", "bucket", "dary", "heapq"),
+                   help="dijkstra priority queue")
+    p.add_argument("--queue-prim", default="heapq", choices=("heapq", "dary"),
+                   help="prim priority queue")
+    p.add_argument("--landmarks", type=int, default=8, help="ALT landmark count")
+    p.add_argument("--delta", type=float, help="delta-stepping bucket width")
+    p.add_argument("--workers", type=int, help="process pool size for boruvka/delta")
+    return p
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    if not args.algorithm and not args.save:
+        parser.error("give an algorithm, --save, or both")
+
+    try:
+        g, positions = load_graph(args.graph)
+    except ImportError as e:
+        parser.error(f"generating graphs needs NumPy: {e}")
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        parser.error(f"cannot load {args.graph}: {e}")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(graph_to_json(g, positions), f)
+    if not args.algorithm:
+        return 0
+    csr = g.freeze()
+
+    try:
+        sources = [parse_vertex(tok, g.n) for tok in args.source]
+        kind = get_algorithm(args.algorithm).kind
+        if kind == "path":
+            if args.pairs:
+                pairs = read_pairs(args.pairs, g.n)
+            elif sources and args.dest:
+                dest = parse_vertex(args.dest, g.n)
+                pairs = [(src, dest) for src in sources]
+            else:
+                parser.error(f"{args.algorithm} needs --source and --dest, or --pairs")
+        elif kind in ("source", "seeds") and not sources:
+            parser.error(f"{args.algorithm} needs --source")
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    def emit(record):
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    try:
+        if kind == "path":
+            run_paths(args, csr, positions, pairs, emit)
+        elif kind == "source":
+            run_source(args, csr, sources, emit)
+        elif kind == "seeds":
+            run_seeds(args, csr, sources, emit)
+        else:
+            run_global(args, csr, emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Graph model and algorithms shared by the GUIs and the command-line runner.
+
+Nothing here imports tkinter.  `import graph_engine` loads only the
+registry; each submodule, including the process-pool backends and the
+NumPy modules, is imported the first time one of its names is used.
+"""
+from importlib import import_module
+
+from .registry import (
+    ALGORITHMS, Algorithm, register, get_algorithm, algorithm_names, run, prepare, trace,
+)
+
+_EXPORTS = {}
+for _module, _names in {
+    "labels": ("INDEX_BASE", "format_vertex", "parse_vertex_token", "index_to_letters"),
+    "model": ("Graph", "ComponentIndex", "CSRGraph", "as_csr",
+              "graph_from_json", "graph_to_json", "load_graph_file"),
+    "cache": ("ResultCache",),
+    "heaps": ("IndexedDaryHeap", "HeapQueue", "BucketQueue"),
+    "traces": ("VISIT", "RELAX", "PUSH", "POP", "ACCEPT", "REJECT", "TRACE_KINDS",
+               "count_events", "replay_edges", "trace_counts"),
+    "traversal": ("dfs_tree_edges", "dfs_spanning_tree", "dfs_trace",
+                  "bfs_spanning_tree", "bfs_trace", "multi_source_bfs", "component_labels"),
+    "paths": ("DIAL_MAX_WEIGHT", "dijkstra", "ShortestPathTree", "dijkstra_trace",
+              "bidirectional_dijkstra", "euclidean_scale", "astar",
+              "single_source_distances", "LandmarkIndex", "alt_search"),
+    "hierarchy": ("ContractionHierarchy", "ch_query"),
+    "parallel": ("delta_stepping", "boruvka"),
+    "mst": ("prim", "prim_trace", "kruskal", "kruskal_trace", "DynamicMST"),
+    "frontier": ("bfs_levels", "frontier_bfs_spanning_tree", "csr_arrays"),
+    "generators": ("GENERATORS", "generate", "parse_spec", "graph_from_arrays",
+                   "erdos_renyi_graph", "grid_graph", "random_geometric_graph",
+                   "barabasi_albert_graph", "knn_graph"),
+}.items():
+    for _name in _names:
+        _EXPORTS[_name] = _module
+del _module, _names, _name
+
+__all__ = ["ALGORITHMS", "Algorithm", "register", "get_algorithm", "algorithm_names",
+           "run", "prepare", "trace"] + list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,124 @@
+"""Level-synchronous BFS over the CSR arrays with NumPy.
+
+Each step expands a whole frontier at once.  While the frontier is small
+it is expanded top-down (every edge out of the frontier); once its edges
+outnumber those left among the unvisited nodes by ALPHA, steps go
+bottom-up instead: every unvisited node looks for any neighbour in the
+frontier and stops at the first one (Beamer's direction-optimizing BFS).
+
+NumPy is needed only by this module.
+"""
+import numpy as np
+
+from .model import as_csr
+
+ALPHA = 14  # go bottom-up when frontier edges > unvisited edges / ALPHA
+BETA = 24   # go back top-down when the frontier shrinks below n / BETA
+BOTTOM_UP_ROUNDS = 8  # neighbour columns tried one at a time before a full scan
+
+
+def csr_arrays(g):
+    """(offsets, targets, weights, sources) of g as NumPy arrays.
+
+    The first three share memory with the CSR snapshot; sources[i] is the
+    node whose adjacency slot i is.
+    """
+    g = as_csr(g)
+    off = np.frombuffer(g.offsets, dtype=np.int64)
+    tgt = np.frombuffer(g.targets, dtype=np.int64)
+    wts = np.frombuffer(g.weights, dtype=np.int64 if g.weights.typecode == "q" else np.float64)
+    src = np.repeat(np.arange(g.n, dtype=np.int64), np.diff(off))
+    return off, tgt, wts, src
+
+
+def _expand(off, nodes):
+    """Every adjacency slot of `nodes`, grouped by node."""
+    start = off[nodes]
+    cnt = off[nodes + 1] - start
+    within = np.arange(cnt.sum()) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+    return np.repeat(start, cnt) + within
+
+
+def _top_down(off, tgt, frontier, level, via, depth):
+    slots = _expand(off, frontier)
+    v = tgt[slots]
+    fresh = level[v] < 0
+    slots, v = slots[fresh], v[fresh]
+    via[v] = slots  # a node reached twice keeps one of its slots ...
+    new = v[via[v] == slots]  # ... and is listed once, by that slot
+    level[new] = depth
+    return new
+
+
+def _bottom_up(off, tgt, src, in_frontier, unvisited, via):
+    """Unvisited nodes with a neighbour in the frontier, each with one such slot."""
+    found = []
+    active = unvisited[off[unvisited + 1] > off[unvisited]]
+    for k in range(BOTTOM_UP_ROUNDS):
+        slots = off[active] + k
+        hit = in_frontier[tgt[slots]]
+        via[active[hit]] = slots[hit]
+        found.append(active[hit])
+        active = active[~hit & (off[active + 1] > slots + 1)]
+        if not len(active):
+            break
+    else:
+        slots = _expand(off, active)
+        slots = slots[(slots - off[src[slots]] >= BOTTOM_UP_ROUNDS) & in_frontier[tgt[slots]]]
+        via[src[slots]] = slots  # any frontier neighbour will do as the parent
+        found.append(np.unique(src[slots]))
+    return np.concatenate(found)
+
+
+def bfs_levels(g, start, arrays=None):
+    """Level-synchronous BFS from `start`, a node or a sequence of seed nodes.
+
+    Returns (level, via, order) as NumPy arrays: level[v] is the hop
+    count (-1 if unreachable), via[v] an adjacency slot of v's tree edge
+    in either endpoint's row (-1 for the root and unreachable nodes), and
+    order lists the reached nodes level by level.  With several seeds,
+    level is the hop count to the nearest one.  Pass `arrays` from
+    csr_arrays() to reuse them.
+    """
+    g = as_csr(g)
+    n = g.n
+    off, tgt, _, src = arrays or csr_arrays(g)
+    deg = np.diff(off)
+    level = np.full(n, -1, dtype=np.int64)
+    via = np.full(n, -1, dtype=np.int64)
+    frontier = np.unique(np.asarray(start, dtype=np.int64))
+    level[frontier] = 0
+    order = [frontier]
+    unvisited_edges = len(tgt) - deg[frontier].sum()
+    bottom_up = False
+    depth = 0
+    while len(frontier):
+        depth += 1
+        frontier_edges = deg[frontier].sum()
+        if not bottom_up:
+            bottom_up = frontier_edges > unvisited_edges / ALPHA
+        elif len(frontier) < n / BETA:
+            bottom_up = False
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            frontier = _bottom_up(off, tgt, src, in_frontier, np.flatnonzero(level < 0), via)
+            level[frontier] = depth
+        else:
+            frontier = _top_down(off, tgt, frontier, level, via, depth)
+        unvisited_edges -= deg[frontier].sum()
+        order.append(frontier)
+    return level, via, np.concatenate(order)
+
+
+def frontier_bfs_spanning_tree(g, start):
+    """Same result shape as bfs_spanning_tree: (tree edges level by level, unreachable)."""
+    g = as_csr(g)
+    arrays = csr_arrays(g)
+    _, tgt, wts, src = arrays
+    level, via, order = bfs_levels(g, start, arrays)
+    child = order[1:]
+    slots = via[child]
+    parent = src[slots] + tgt[slots] - child  # the slot's other endpoint
+    tree = list(zip(parent.tolist(), child.tolist(), wts[slots].tolist()))
+    return tree, [v for v in np.flatnonzero(level < 0).tolist() if v not in g.removed]
@@ -0,0 +1,256 @@
+"""Seeded random graph families built with NumPy (no per-edge Python loop).
+
+Every generator returns (Graph, positions) with positions in the unit
+square; the same seed always gives the same graph.  Weights are integers
+in 1..max_weight: uniform for the abstract families, proportional to the
+edge length for the geometric ones (so A* has a meaningful heuristic).
+
+NumPy is needed only by this module.
+"""
+import inspect
+import math
+from array import array
+
+import numpy as np
+
+from .model import Graph, CSRGraph
+
+
+def graph_from_arrays(n, u, v, w):
+    """Graph (with its CSR snapshot ready) from parallel edge arrays.
+
+    The pairs must already be simple: no self-loops and no repeats.
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    w = np.asarray(w)
+    w = w.astype(np.int64 if np.issubdtype(w.dtype, np.integer) else np.float64)
+    lo, hi = np.minimum(u, v), np.maximum(u, v)
+    order = np.lexsort((hi, lo, w))  # the (w, u, v) order of Graph.edges
+    lo, hi, w = lo[order], hi[order], w[order]
+
+    src = np.concatenate((lo, hi))
+    by_src = np.argsort(src, kind="stable")
+    dst = np.concatenate((hi, lo))[by_src]
+    ww = np.concatenate((w, w))[by_src]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+
+    g = Graph(n)
+    pairs = list(zip(dst.tolist(), ww.tolist()))
+    off = offsets.tolist()
+    g.adj = [pairs[off[i]:off[i + 1]] for i in range(n)]
+    lo_list, hi_list, w_list = lo.tolist(), hi.tolist(), w.tolist()
+    g.edges = list(zip(w_list, lo_list, hi_list))
+    g.edge_index = dict(zip(zip(lo_list, hi_list), w_list))
+    g.components.stale = True  # rebuilt from the edge table on the first query
+    code = "q" if w.dtype == np.int64 else "d"
+    g._csr = CSRGraph(n, array("q", offsets.tobytes()), array("q", dst.tobytes()),
+                      array(code, ww.tobytes()),
+                      sorted_edges=(array("q", lo.tobytes()), array("q", hi.tobytes()),
+                                    array(code, w.tobytes())))
+    return g
+
+
+def _simple(n, u, v):
+    """Drop self-loops and repeated pairs; returns (lo, hi) sorted by pair."""
+    keep = u != v
+    lo, hi = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+    keys = np.unique(lo * n + hi)
+    return keys // n, keys % n
+
+
+def _positions(pts):
+    return list(map(tuple, pts.tolist()))
+
+
+def _length_weights(d, reach, max_weight):
+    """Edge lengths scaled so a length of `reach` weighs max_weight."""
+    return np.maximum(1, np.ceil(d * (max_weight / reach))).astype(np.int64)
+
+
+def _cell_pairs(pts, cell, chunk=1 << 16):
+    """Yield (row, col, i, j, distance) for every pair i != j in adjacent grid cells.
+
+    The unit square is cut into square cells at least `cell` wide, so any
+    two points closer than `cell` are reported.  Work is done a chunk of
+    points at a time to bound memory; within a chunk, `row` numbers the
+    points i and `col` numbers each point's candidates j from 0, which
+    lays the pairs out as a padded matrix without sorting.
+    """
+    n = len(pts)
+    g = max(1, min(int(1 / cell), 1 << 12))
+    c = np.minimum((pts * g).astype(np.int64), g - 1)
+    cid = c[:, 0] * g + c[:, 1]
+    order = np.argsort(cid, kind="stable")
+    start = np.zeros(g * g + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cid, minlength=g * g), out=start[1:])
+    for first in range(0, n, chunk):
+        ii = order[first:first + chunk]
+        rows = np.arange(len(ii))
+        cx, cy = c[ii, 0], c[ii, 1]
+        used = np.zeros(len(ii), dtype=np.int64)  # candidates laid out so far, per row
+        parts = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = cx + dx, cy + dy
+                ok = (nx >= 0) & (nx < g) & (ny >= 0) & (ny < g)
+                cells = nx[ok] * g + ny[ok]
+                s = start[cells]
+                cnt = start[cells + 1] - s
+                # position t of group q maps to s[q] + (t - first position of q)
+                within = np.arange(cnt.sum()) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+                row = np.repeat(rows[ok], cnt)
+                parts.append((row, used[row] + within, order[np.repeat(s, cnt) + within]))
+                used[ok] += cnt
+        row, col, j = (np.concatenate(p) for p in zip(*parts))
+        i = ii[row]
+        keep = i != j
+        row, col, i, j = row[keep], col[keep], i[keep], j[keep]
+        yield row, col, i, j, np.hypot(*(pts[i] - pts[j]).T)
+
+
+# ---------- Families ----------
+def erdos_renyi_graph(n, m=None, seed=None, max_weight=100):
+    """G(n, m): m distinct node pairs chosen uniformly (default m = 2n, or every pair if fewer)."""
+    m = min(2 * n, n * (n - 1) // 2) if m is None else m
+    if m > n * (n - 1) // 2:
+        raise ValueError(f"{n} nodes hold at most {n * (n - 1) // 2} edges, not {m}")
+    rng = np.random.default_rng(seed)
+    lo = hi = np.zeros(0, dtype=np.int64)
+    while len(lo) < m:
+        extra = m - len(lo)
+        extra += extra // 8 + 16  # room for the self-loops and repeats dropped below
+        lo, hi = _simple(n, np.concatenate((lo, rng.integers(0, n, extra))),
+                         np.concatenate((hi, rng.integers(0, n, extra))))
+    pick = np.sort(rng.permutation(len(lo))[:m])
+    w = rng.integers(1, max_weight + 1, m)
+    return graph_from_arrays(n, lo[pick], hi[pick], w), _positions(rng.random((n, 2)))
+
+
+def grid_graph(n, cols=None, seed=None, max_weight=100):
+    """rows x cols lattice of exactly n nodes; cols defaults to ceil(sqrt(n)) and
+    the last row may be partial."""
+    cols = cols or max(1, math.ceil(math.sqrt(n)))
+    rows = max(1, math.ceil(n / cols))
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    u, v = u[v < n], v[v < n]  # v > u, so this drops every edge into the unfilled cells
+    w = rng.integers(1, max_weight + 1, len(u))
+    r, c = np.divmod(np.arange(n), cols)
+    pts = np.column_stack((c / max(1, cols - 1), r / max(1, rows - 1)))
+    return graph_from_arrays(n, u, v, w), _positions(pts)
+
+
+def random_geometric_graph(n, radius=None, seed=None, max_weight=100):
+    """Uniform points joined when closer than `radius` (default: average degree about 8)."""
+    radius = radius or math.sqrt(8 / (math.pi * max(1, n)))
+    rng = np.random.default_rng(seed)
+    pts = rng.random((n, 2))
+    us, vs, ds = [], [], []
+    for _, _, i, j, d in _cell_pairs(pts, radius):
+        keep = (i < j) & (d <= radius)
+        us.append(i[keep])
+        vs.append(j[keep])
+        ds.append(d[keep])
+    u, v, d = (np.concatenate(parts) for parts in (us, vs, ds))
+    return graph_from_arrays(n, u, v, _length_weights(d, radius, max_weight)), _positions(pts)
+
+
+def barabasi_albert_graph(n, m=2, seed=None, max_weight=100):
+    """Preferential attachment: node t links to about m earlier nodes chosen by degree.
+
+    Batagelj-Brandes: entry 2k of the endpoint list is the node adding its
+    k-th edge and entry 2k + 1 copies a uniformly chosen earlier entry.
+    The copies are resolved all at once by following odd entries back to
+    an even one.  Self-loops and repeats are dropped, so a node can end up
+    with fewer than m edges.
+    """
+    rng = np.random.default_rng(seed)
+    k = np.arange(n * m, dtype=np.int64)
+    pick = (rng.random(n * m) * (2 * k + 1)).astype(np.int64)  # uniform in [0, 2k]
+    pos = pick.copy()
+    odd = np.flatnonzero(pos & 1)
+    while len(odd):
+        pos[odd] = pick[(pos[odd] - 1) // 2]
+        odd = odd[(pos[odd] & 1) == 1]
+    lo, hi = _simple(n, k // m, pos // 2 // m)
+    w = rng.integers(1, max_weight + 1, len(lo))
+    return graph_from_arrays(n, lo, hi, w), _positions(rng.random((n, 2)))
+
+
+def knn_graph(n, k=4, seed=None, max_weight=100):
+    """Uniform points, each joined to its k nearest neighbours (mutual pairs once).
+
+    Neighbours are searched in the surrounding 3 x 3 grid cells, each
+    holding about k points, which finds the true k nearest for all but
+    points in unusually sparse spots.
+    """
+    rng = np.random.default_rng(seed)
+    pts = rng.random((n, 2))
+    none = np.zeros(0, dtype=np.int64)
+    us, vs, ds = [none], [none], [np.zeros(0)]
+    for row, col, i, j, d in _cell_pairs(pts, math.sqrt(k / max(1, n))):
+        if not len(row):
+            continue  # a single point has no candidates
+        # candidate distances as one padded row per point, then a partial sort per row
+        dist = np.full((row.max() + 1, col.max() + 1), np.inf)
+        dist[row, col] = d
+        slot = np.full(dist.shape, -1)
+        slot[row, col] = np.arange(len(i))
+        if dist.shape[1] > k:
+            best = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            dist = np.take_along_axis(dist, best, axis=1)
+            slot = np.take_along_axis(slot, best, axis=1)
+        slot = slot[np.isfinite(dist)]
+        us.append(i[slot])
+        vs.append(j[slot])
+        ds.append(d[slot])
+    u, v, d = (np.concatenate(parts) for parts in (us, vs, ds))
+    lo, hi = np.minimum(u, v), np.maximum(u, v)
+    _, first = np.unique(lo * n + hi, return_index=True)
+    d = d[first]
+    reach = d.max() if len(d) else 1.0
+    return (graph_from_arrays(n, lo[first], hi[first], _length_weights(d, reach, max_weight)),
+            _positions(pts))
+
+
+GENERATORS = {
+    "er": erdos_renyi_graph,
+    "grid": grid_graph,
+    "geometric": random_geometric_graph,
+    "ba": barabasi_albert_graph,
+    "knn": knn_graph,
+}
+
+
+def generate(family, n, seed=None, **params):
+    """Run a generator by its GENERATORS name."""
+    fn = GENERATORS.get(family)
+    if fn is None:
+        raise ValueError(f"unknown graph family {family!r}; "
+                         f"choose from {', '.join(GENERATORS)}")
+    if n < 1:
+        raise ValueError("a generated graph needs at least one node")
+    try:  # only a bad parameter name becomes a ValueError, not a TypeError from inside
+        inspect.signature(fn).bind(n, seed=seed, **params)
+    except TypeError as e:
+        raise ValueError(f"{family}: {e}") from None
+    return fn(n, seed=seed, **params)
+
+
+def parse_spec(spec):
+    """'family:key=value,...' -> (family, params), e.g. 'er:n=250000,m=1000000,seed=7'."""
+    family, _, rest = spec.partition(":")
+    params = {}
+    for item in filter(None, rest.split(",")):
+        key, eq, value = item.partition("=")
+        if not eq:
+            raise ValueError(f"expected key=value, got {item!r}")
+        try:
+            params[key.strip()] = int(value)
+        except ValueError:
+            params[key.strip()] = float(value)
+    return family.strip(), params
@@ -0,0 +1,129 @@
+"""Priority queues: with decrease-key, and lazy-deletion ones for resumable searches."""
+from heapq import heappush, heappop
+import math
+
+
+# ---------- Indexed d-ary heap ----------
+class IndexedDaryHeap:
+    """Min-heap over node ids 0..n-1 with true decrease-key.
+
+    Each node is in the heap at most once, so it never holds more than n
+    entries (a plain heapq with lazy deletion can grow to O(E)).
+    """
+    def __init__(self, n, d=4):
+        self.d = d
+        self.heap = []
+        self.key = [math.inf] * n
+        self.pos = [-1] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push_or_decrease(self, v, k):
+        """Insert v, or lower its key; returns False if k is not an improvement."""
+        if k >= self.key[v]:
+            return False
+        self.key[v] = k
+        i = self.pos[v]
+        if i == -1:
+            i = len(self.heap)
+            self.heap.append(v)
+        self._sift_up(i, v)
+        return True
+
+    def pop(self):
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            self._sift_down(0, last)
+        return self.key[top], top
+
+    def _sift_up(self, i, v):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        k = key[v]
+        while i > 0:
+            p = (i - 1) // d
+            pv = heap[p]
+            if key[pv] <= k:
+                break
+            heap[i] = pv
+            pos[pv] = i
+            i = p
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i, v):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        k = key[v]
+        size = len(heap)
+        while True:
+            first = i * d + 1
+            if first >= size:
+                break
+            best = first
+            bk = key[heap[first]]
+            for c in range(first + 1, min(first + d, size)):
+                ck = key[heap[c]]
+                if ck < bk:
+                    best, bk = c, ck
+            if bk >= k:
+                break
+            cv = heap[best]
+            heap[i] = cv
+            pos[cv] = i
+            i = best
+        heap[i] = v
+        pos[v] = i
+
+
+# ---------- Lazy-deletion queues (push / pop only) ----------
+class HeapQueue:
+    """heapq with lazy deletion: a key can be pushed again and the caller
+    skips entries that are already settled."""
+    name = "heapq"
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, k, v):
+        heappush(self.heap, (k, v))
+
+    def pop(self):
+        return heappop(self.heap)
+
+
+class BucketQueue:
+    """Dial's buckets for integer keys, same interface as HeapQueue.
+
+    Keys must be pushed in [last popped key, last popped key + max_step],
+    as they are in Dijkstra with integer weights up to max_step, so
+    max_step + 1 circular buckets hold each pending key exactly.
+    """
+    name = "bucket"
+
+    def __init__(self, max_step):
+        self.buckets = [[] for _ in range(max_step + 1)]
+        self.key = 0
+        self.pending = 0
+
+    def __len__(self):
+        return self.pending
+
+    def push(self, k, v):
+        self.buckets[k % len(self.buckets)].append(v)
+        self.pending += 1
+
+    def pop(self):
+        buckets, nb, k = self.buckets, len(self.buckets), self.key
+        b = buckets[k % nb]
+        while not b:
+            k += 1
+            b = buckets[k % nb]
+        self.key = k
+        self.pending -= 1
+        return k, b.pop()
@@ -0,0 +1,217 @@
+"""Contraction hierarchies: preprocessing once, fast queries after."""
+from heapq import heappush, heappop
+import math
+import time
+from array import array
+
+from .model import as_csr
+
+
+# ---------- Contraction Hierarchies ----------
+class ContractionHierarchy:
+    """Contraction-hierarchy preprocessing plus a bidirectional upward query.
+
+    Nodes are contracted in order of (edge difference + contracted
+    neighbours), re-evaluated lazily when a node reaches the queue head.
+    A shortcut a-b through v is added only when a bounded witness search
+    finds no path of equal or shorter length that avoids v; priorities use
+    a cheaper search (`estimate_limit` settled nodes) than the contraction.
+    `middle` remembers the bypassed node of every shortcut so query() can
+    unpack paths back into real edges.
+    """
+    def __init__(self, g, witness_limit=500, estimate_limit=10):
+        g = as_csr(g)
+        t0 = time.perf_counter()
+        self.graph = g
+        n = g.n
+        off, tgt, wts = g.offsets, g.targets, g.weights
+
+        # overlay graph of not-yet-contracted nodes, parallel edges collapsed
+        adj = [dict() for _ in range(n)]
+        for u in range(n):
+            row = adj[u]
+            for i in range(off[u], off[u + 1]):
+                v, w = tgt[i], wts[i]
+                if v != u and (v not in row or w < row[v]):
+                    row[v] = w
+        self._adj = adj
+        self.middle = {}
+        self.rank = [0] * n
+        self.num_shortcuts = 0
+        up = [None] * n
+        deleted = [0] * n
+
+        def priority(v):
+            shortcuts = len(self._shortcuts(v, estimate_limit))
+            return shortcuts - len(adj[v]) + deleted[v]
+
+        prio = [priority(v) for v in range(n)]
+        heap = [(p, v) for v, p in enumerate(prio)]
+        heap.sort()
+        order = 0
+        while heap:
+            p, v = heappop(heap)
+            if up[v] is not None or p != prio[v]:
+                continue  # contracted already, or a stale priority
+            p = priority(v)
+            if heap and p > heap[0][0]:
+                prio[v] = p
+                heappush(heap, (p, v))
+                continue
+
+            for a, b, w in self._shortcuts(v, witness_limit):
+                if b not in adj[a] or w < adj[a][b]:
+                    if b not in adj[a]:
+                        self.num_shortcuts += 1
+                    adj[a][b] = w
+                    adj[b][a] = w
+                    self.middle[(a, b) if a < b else (b, a)] = v
+            up[v] = adj[v]
+            for a in adj[v]:
+                del adj[a][v]
+                deleted[a] += 1
+            adj[v] = {}
+            self.rank[v] = order
+            order += 1
+
+
+        # freeze the upward graph into CSR arrays
+        self.up_offsets = array("q", [0]) * (n + 1)
+        self.up_targets = array("q")
+        flat_w = []
+        for u in range(n):
+            for v, w in up[u].items():
+                self.up_targets.append(v)
+                flat_w.append(w)
+            self.up_offsets[u + 1] = len(self.up_targets)
+        self.up_weights = array(g.weights.typecode, flat_w)
+        del self._adj
+        self.preprocess_seconds = time.perf_counter() - t0
+
+    def _shortcuts(self, v, settle_limit):
+        """Shortcuts (a, b, w) needed if v were contracted now."""
+        adj = self._adj
+        nbrs = list(adj[v].items())
+        result = []
+        for i, (a, wa) in enumerate(nbrs):
+            targets = {b: wa + wb for b, wb in nbrs[i + 1:]}
+            if not targets:
+                continue
+            dist = self._witness(a, v, targets, max(targets.values()), settle_limit)
+            for b, via in targets.items():
+                if dist.get(b, math.inf) > via:
+                    result.append((a, b, via))
+        return result
+
+    def _witness(self, src, skip, targets, limit, settle_limit):
+        """Dijkstra from src that avoids `skip`, bounded by length and settle count."""
+        adj = self._adj
+        dist = {src: 0}
+        heap = [(0, src)]
+        remaining = len(targets)
+        settled = 0
+        while heap and remaining and settled < settle_limit:
+            d, u = heappop(heap)
+            if d != dist[u]:
+                continue
+            if d > limit:
+                break
+            settled += 1
+            if u in targets:
+                remaining -= 1
+            for x, w in adj[u].items():
+                if x == skip:
+                    continue
+                nd = d + w
+                if nd < dist.get(x, math.inf):
+                    dist[x] = nd
+                    heappush(heap, (nd, x))
+        return dist
+
+    def is_valid_for(self, g):
+        return as_csr(g) is self.graph
+
+    @property
+    def num_up_edges(self):
+        return len(self.up_targets)
+
+    def query(self, src, dest, stats=None):
+        """Shortest path via bidirectional upward search; same shape as dijkstra()."""
+        off, tgt, wts = self.up_offsets, self.up_targets, self.up_weights
+        dist = ({src: 0}, {dest: 0})
+        parent = ({src: -1}, {dest: -1})
+        heaps = ([(0, src)], [(0, dest)])
+        best = math.inf
+        meet = -1
+        settled = 0
+
+        while heaps[0] or heaps[1]:
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            d, u = heappop(heaps[side])
+            if d >= best:
+                heaps[side].clear()
+                continue
+            my_dist = dist[side]
+            if d != my_dist[u]:
+                continue
+            settled += 1
+            od = dist[1 - side].get(u)
+            if od is not None and d + od < best:
+                best = d + od
+                meet = u
+            # stall-on-demand: a higher node already reaches u more cheaply
+            lo, hi = off[u], off[u + 1]
+            stalled = False
+            for i in range(lo, hi):
+                dv = my_dist.get(tgt[i])
+                if dv is not None and dv + wts[i] < d:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            for i in range(lo, hi):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < my_dist.get(v, math.inf):
+                    my_dist[v] = nd
+                    parent[side][v] = u
+                    heappush(heaps[side], (nd, v))
+
+        if stats is not None:
+            stats["settled"] = settled
+        if meet == -1:
+            return math.inf, []
+
+        up_path = []
+        cur = meet
+        while cur != -1:
+            up_path.append(cur)
+            cur = parent[0][cur]
+        up_path.reverse()
+        cur = parent[1][meet]
+        while cur != -1:
+            up_path.append(cur)
+            cur = parent[1][cur]
+        return best, self.unpack(up_path)
+
+    def unpack(self, path):
+        """Replace every shortcut on path by the real edges it stands for."""
+        if not path:
+            return []
+        out = [path[0]]
+        for a, b in zip(path, path[1:]):
+            stack = [(a, b)]
+            while stack:
+                x, y = stack.pop()
+                m = self.middle.get((x, y) if x < y else (y, x))
+                if m is None:
+                    out.append(y)
+                else:
+                    stack.append((m, y))
+                    stack.append((x, m))
+        return out
+
+
+def ch_query(hierarchy, src, dest, stats=None):
+    """Registry entry point: hierarchy.query() as a plain function."""
+    return hierarchy.query(src, dest, stats)
@@ -0,0 +1,25 @@
+"""Vertex labels as shown in the GUI (1, 2, 3, ...)."""
+
+INDEX_BASE = 1
+
+label_to_index = {}
+index_to_label = {}
+
+
+def index_to_letters(i: int) -> str:
+    """แปลง 0 -> 1, 1 -> 2, ..."""
+    return str(i + 1)
+
+
+def format_vertex(i: int) -> str:
+    return index_to_letters(i)
+
+
+def parse_vertex_token(tok: str) -> int:
+    tok = tok.strip()
+    if tok.isdigit():
+        return int(tok) - INDEX_BASE
+    if tok in label_to_index:
+        return label_to_index[tok]
+    print("Unknown vertex label:", tok)
+    raise SystemExit
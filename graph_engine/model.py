@@ -0,0 +1,405 @@
+"""Editable Graph, its CSR snapshot, connectivity index and .json format."""
+from bisect import insort, bisect_left
+from collections import deque
+import itertools
+import json
+import sys
+from array import array
+
+
+class Graph:
+    """Mutable staging buffer used by the editor; call freeze() before a run.
+
+    `edges` holds every undirected edge once as (w, u, v) with u <= v and is
+    kept sorted, so Kruskal never has to sort it again.
+
+    `edge_index` maps each node pair (u, v), u <= v, to the lightest
+    weight between them, so weight lookups and existence checks are O(1)
+    and removal only touches the two adjacency lists.  Pairs joined by
+    parallel edges also keep all their weights, sorted, in `_parallel`.
+
+    Node ids are stable: remove_node() leaves a tombstone (the id goes into
+    `removed` and keeps an empty adjacency list) instead of renumbering, so
+    `n` counts ids ever handed out and `num_nodes` the nodes that exist.
+
+    `version` changes on every mutation and is unique across Graph objects
+    (the editor replaces the graph when a file is loaded), so it can key
+    cached results.
+    """
+    _versions = itertools.count()
+
+    def __init__(self, n):
+        self.n = n
+        self.adj = [[] for _ in range(n)]
+        self.edges = []
+        self.edge_index = {}
+        self._parallel = {}
+        self.removed = set()
+        self.components = ComponentIndex(n)
+        self.version = next(Graph._versions)
+        self._csr = None
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """Bulk-build from (u, v, w) triples: one sort instead of an insort per edge."""
+        g = cls(n)
+        adj, table, index = g.adj, [], g.edge_index
+        union = g.components.union
+        for u, v, w in edges:
+            adj[u].append((v, w))
+            adj[v].append((u, w))
+            if u > v:
+                u, v = v, u
+            table.append((w, u, v))
+            if (u, v) in index:
+                g._index_parallel((u, v), w)
+            else:
+                index[u, v] = w
+            union(u, v)
+        table.sort()
+        g.edges = table
+        return g
+
+    @property
+    def num_nodes(self):
+        return self.n - len(self.removed)
+
+    def is_live(self, v):
+        return 0 <= v < self.n and v not in self.removed
+
+    def add_node(self):
+        """Append one isolated node in amortized O(1); returns its id."""
+        self.adj.append([])
+        self.n += 1
+        self.components.add_node()
+        self.version = next(Graph._versions)
+        self._csr = None
+        return self.n - 1
+
+    def add_nodes(self, k):
+        """Append k isolated nodes in O(k); returns the range of their ids.
+
+        The adjacency list and the union-find arrays grow in place (list
+        over-allocation makes a run of appends amortized O(1) each), so
+        nothing that already exists is copied.
+        """
+        first = self.n
+        self.adj.extend([] for _ in range(k))
+        self.n += k
+        self.components.add_nodes(k)
+        self.version = next(Graph._versions)
+        self._csr = None
+        return range(first, self.n)
+
+    def has_edge(self, u, v):
+        return ((u, v) if u <= v else (v, u)) in self.edge_index
+
+    def weight(self, u, v, default=None):
+        """Weight of the (lightest) edge between u and v."""
+        return self.edge_index.get((u, v) if u <= v else (v, u), default)
+
+    def _index_parallel(self, key, w):
+        weights = self._parallel.setdefault(key, [self.edge_index[key]])
+        insort(weights, w)
+        self.edge_index[key] = weights[0]
+
+    def add_edge(self, u, v, w):
+        self.adj[u].append((v, w))
+        self.adj[v].append((u, w))
+        key = (u, v) if u <= v else (v, u)
+        insort(self.edges, (w,) + key)
+        if key in self.edge_index:
+            self._index_parallel(key, w)
+        else:
+            self.edge_index[key] = w
+        self.components.union(u, v)
+        self.version = next(Graph._versions)
+        self._csr = None
+
+    def remove_edge(self, u, v, w):
+        """Remove one u-v edge of weight w in O(deg(u) + deg(v)); False if there is none."""
+        if not self._drop_edge(u, v, w):
+            return False
+        # the index survives unless this edge was u and v's last link
+        if not self.has_edge(u, v) and u != v and not self._still_connected(u, v):
+            self.components.stale = True
+        self.version = next(Graph._versions)
+        self._csr = None
+        return True
+
+    def remove_node(self, x):
+        """Delete node x and its edges in O(sum of its neighbours' degrees).
+
+        x becomes a tombstone; no other id changes.  Returns the removed
+        edges as (x, y, w).
+        """
+        removed = []
+        for y, w in list(self.adj[x]):
+            if self._drop_edge(x, y, w):  # False for a self-loop's second listing
+                removed.append((x, y, w))
+        self.removed.add(x)
+        neighbours = list({y for _, y, _ in removed if y != x})
+        if not neighbours:
+            self.components.count -= 1  # x was a component of its own
+        elif not all(self._still_connected(neighbours[0], y) for y in neighbours[1:]):
+            self.components.stale = True
+        # otherwise x's union-find set lives on as its neighbours' component
+        self.version = next(Graph._versions)
+        self._csr = None
+        return removed
+
+    def _drop_edge(self, u, v, w):
+        key = (u, v) if u <= v else (v, u)
+        if self.edge_index.get(key) is None:
+            return False
+        weights = self._parallel.get(key)
+        if weights is not None:
+            if w not in weights:
+                return False
+            weights.remove(w)
+            self.edge_index[key] = weights[0]
+            if len(weights) == 1:
+                del self._parallel[key]
+        elif self.edge_index[key] != w:
+            return False
+        else:
+            del self.edge_index[key]
+        self.adj[u].remove((v, w))
+        self.adj[v].remove((u, w))
+        del self.edges[bisect_left(self.edges, (w,) + key)]
+        return True
+
+    def _still_connected(self, u, v, budget=4096):
+        """True if u and v are provably still connected after an edge removal.
+
+        Grows BFS balls around both ends, always the one with the smaller
+        queue, until they touch (True), one runs dry so the graph really
+        split (False), or `budget` nodes were seen (False: unknown).
+        """
+        seen = ({u}, {v})
+        queues = (deque([u]), deque([v]))
+        while queues[0] and queues[1] and budget > 0:
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            mine, other = seen[side], seen[1 - side]
+            for y, _ in self.adj[queues[side].popleft()]:
+                if y in other:
+                    return True
+                if y not in mine:
+                    mine.add(y)
+                    queues[side].append(y)
+                    budget -= 1
+        return False
+
+    def _fresh_components(self):
+        if self.components.stale:
+            self.components = ComponentIndex(self.n)
+            self.components.count -= len(self.removed)  # tombstones are not components
+            for _, u, v in self.edges:
+                self.components.union(u, v)
+        return self.components
+
+    def connected(self, u, v):
+        return self._fresh_components().same(u, v)
+
+    def component_count(self):
+        return self._fresh_components().count
+
+    def freeze(self):
+        """Return a CSRGraph snapshot (cached until the next edit)."""
+        if self._csr is None:
+            self._csr = CSRGraph.from_adjacency(self.n, self.adj, self.edges,
+                                                removed=frozenset(self.removed))
+        return self._csr
+
+    def nbytes(self):
+        """Approximate size of the list/tuple adjacency in bytes."""
+        total = sys.getsizeof(self.adj) + sys.getsizeof(self.edges)
+        total += sys.getsizeof(self.edge_index) + sys.getsizeof((0, 0)) * len(self.edge_index)
+        for lst in self.adj:
+            total += sys.getsizeof(lst)
+            for t in lst:
+                total += sys.getsizeof(t)
+        for t in self.edges:
+            total += sys.getsizeof(t)
+        return total
+
+
+# ---------- Connectivity (union-find) ----------
+class ComponentIndex:
+    """Union-find over the nodes: connectivity queries in O(α(n)).
+
+    Edge and node insertions are applied as they happen.  A deletion can
+    split a component, which union-find cannot undo, so Graph only marks
+    the index stale and rebuilds it from the edge table on the next query.
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.count = n
+        self.stale = False
+
+    def add_node(self):
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        self.count += 1
+
+    def add_nodes(self, k):
+        self.parent.extend(range(len(self.parent), len(self.parent) + k))
+        self.size.extend([1] * k)
+        self.count += k
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, u, v):
+        ru, rv = self.find(u), self.find(v)
+        if ru == rv:
+            return False
+        if self.size[ru] < self.size[rv]:
+            ru, rv = rv, ru
+        self.parent[rv] = ru
+        self.size[ru] += self.size[rv]
+        self.count -= 1
+        return True
+
+    def same(self, u, v):
+        return self.find(u) == self.find(v)
+
+
+# ---------- CSR (compressed sparse row) ----------
+class CSRGraph:
+    """Read-only adjacency in three flat arrays.
+
+    Neighbours of u are targets[offsets[u]:offsets[u + 1]] with the matching
+    weights; every undirected edge is stored once per direction.  Integer
+    weights stay integers ('q'), anything else is stored as 'd'.
+
+    sorted_edges() gives each undirected edge once, ordered by weight, as
+    parallel arrays (u, v, w).
+
+    `removed` holds the ids of deleted nodes: isolated rows that do not
+    count as nodes, so spanning trees need num_nodes - 1 edges.
+    """
+    def __init__(self, n, offsets, targets, weights, sorted_edges=None, removed=frozenset()):
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.removed = removed
+        self._sorted = sorted_edges
+        self._int_bound = None
+
+    @classmethod
+    def from_adjacency(cls, n, adj, edges=None, removed=frozenset()):
+        """Build from adjacency lists; `edges` is an optional presorted (w, u, v) table."""
+        offsets = array("q", [0]) * (n + 1)
+        targets = array("q")
+        flat_w = []
+        pos = 0
+        for u in range(n):
+            row = adj[u]
+            for v, w in row:
+                targets.append(v)
+                flat_w.append(w)
+            pos += len(row)
+            offsets[u + 1] = pos
+        if all(type(w) is int for w in flat_w):
+            weights = array("q", flat_w)
+        else:
+            weights = array("d", flat_w)
+        g = cls(n, offsets, targets, weights, removed=removed)
+        if edges is not None:
+            g._sorted = (array("q", [u for _, u, _ in edges]),
+                         array("q", [v for _, _, v in edges]),
+                         array(weights.typecode, [w for w, _, _ in edges]))
+        return g
+
+    @property
+    def num_nodes(self):
+        return self.n - len(self.removed)
+
+    @property
+    def num_edges(self):
+        return len(self.targets) // 2
+
+    def neighbors(self, u):
+        t, wt = self.targets, self.weights
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            yield t[i], wt[i]
+
+    def integer_weight_bound(self):
+        """Largest weight if every weight is a non-negative int, else None (cached)."""
+        if self._int_bound is None:
+            wts = self.weights
+            ok = wts.typecode == "q" and (not wts or min(wts) >= 0)
+            self._int_bound = ((max(wts) if wts else 0) if ok else None,)
+        return self._int_bound[0]
+
+    def sorted_edges(self):
+        if self._sorted is None:
+            off, tgt, wts = self.offsets, self.targets, self.weights
+            # self-loops are dropped here; they can never be in a spanning tree
+            table = sorted((wts[i], u, tgt[i]) for u in range(self.n)
+                           for i in range(off[u], off[u + 1]) if u < tgt[i])
+            self._sorted = (array("q", [u for _, u, _ in table]),
+                            array("q", [v for _, _, v in table]),
+                            array(wts.typecode, [w for w, _, _ in table]))
+        return self._sorted
+
+    def nbytes(self):
+        arrays = [self.offsets, self.targets, self.weights]
+        if self._sorted is not None:
+            arrays.extend(self._sorted)
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    def bytes_per_edge(self):
+        m = self.num_edges
+        return self.nbytes() / m if m else 0.0
+
+
+def as_csr(g):
+    """Algorithms accept either a Graph or an already frozen CSRGraph."""
+    if isinstance(g, CSRGraph):
+        return g
+    return g.freeze()
+
+
+# ---------- Saved graphs (.json) ----------
+def graph_from_json(data):
+    """(Graph, node positions) from the dict written by the GUI's Save As."""
+    positions = [(float(n["x"]), float(n["y"])) for n in data.get("nodes", [])]
+    n = len(positions)
+    edges = []
+    for e in data.get("edges", []):
+        u = int(e["u"])
+        v = int(e["v"])
+        w = e["w"]
+        # keep integer weights integral so Dijkstra can use bucket queues
+        w = w if isinstance(w, int) else float(w)
+        if 0 <= u < n and 0 <= v < n:
+            edges.append((u, v, w))
+    return Graph.from_edges(n, edges), positions
+
+
+def graph_to_json(g, positions):
+    """The .json dict; ids of deleted nodes are squeezed out, so files stay dense."""
+    if not g.removed:
+        return {
+            "nodes": [{"x": x, "y": y} for (x, y) in positions],
+            "edges": [{"u": u, "v": v, "w": w} for (w, u, v) in g.edges],
+        }
+    live = [v for v in range(g.n) if v not in g.removed]
+    new_id = {v: i for i, v in enumerate(live)}
+    return {
+        "nodes": [{"x": positions[v][0], "y": positions[v][1]} for v in live],
+        "edges": [{"u": new_id[u], "v": new_id[v], "w": w} for (w, u, v) in g.edges],
+    }
+
+
+def load_graph_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return graph_from_json(json.load(f))
@@ -0,0 +1,308 @@
+"""Minimum spanning trees: Prim, Kruskal and the live DynamicMST."""
+from heapq import heappush, heappop
+from collections import deque
+import math
+
+from .heaps import IndexedDaryHeap
+from .model import as_csr
+from .traces import VISIT, PUSH, POP, ACCEPT, REJECT
+
+
+# ---------- Prim ----------
+def prim(g, start, queue="heapq"):
+    """Prim's MST from `start`; queue="dary" keeps one entry per node via decrease-key."""
+    g = as_csr(g)
+    if queue == "dary":
+        return _prim_indexed(g, start)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    visited[start] = True
+    heap = []
+
+    for i in range(off[start], off[start + 1]):
+        heappush(heap, (wts[i], start, tgt[i]))
+
+    mst = []
+    total = 0
+    target = g.num_nodes - 1
+
+    while heap and len(mst) < target:
+        w, u, v = heappop(heap)
+        if visited[v]:
+            continue
+
+        visited[v] = True
+        mst.append((u, v, w))
+        total += w
+
+        for i in range(off[v], off[v + 1]):
+            to = tgt[i]
+            if not visited[to]:
+                heappush(heap, (wts[i], v, to))
+
+    if len(mst) != target:
+        return None, math.inf
+    return mst, total
+
+
+def prim_trace(g, start):
+    """Step events for prim(queue="heapq"); heap entries are edges u-v."""
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    visited[start] = True
+    yield VISIT, -1, start, 0
+    heap = []
+    for i in range(off[start], off[start + 1]):
+        heappush(heap, (wts[i], start, tgt[i]))
+        yield PUSH, start, tgt[i], wts[i]
+
+    taken = 0
+    target = g.num_nodes - 1
+    while heap and taken < target:
+        w, u, v = heappop(heap)
+        yield POP, u, v, w
+        if visited[v]:
+            yield REJECT, u, v, w
+            continue
+        visited[v] = True
+        taken += 1
+        yield ACCEPT, u, v, w
+        yield VISIT, u, v, w
+        for i in range(off[v], off[v + 1]):
+            to = tgt[i]
+            if not visited[to]:
+                heappush(heap, (wts[i], v, to))
+                yield PUSH, v, to, wts[i]
+
+
+def _prim_indexed(g, start):
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    via = [-1] * g.n
+    pq = IndexedDaryHeap(g.n)
+    pq.push_or_decrease(start, 0)
+
+    mst = []
+    total = 0
+
+    while pq:
+        w, v = pq.pop()
+        visited[v] = True
+        if via[v] != -1:
+            mst.append((via[v], v, w))
+            total += w
+        for i in range(off[v], off[v + 1]):
+            to = tgt[i]
+            if not visited[to] and pq.push_or_decrease(to, wts[i]):
+                via[to] = v
+
+    if len(mst) != g.num_nodes - 1:
+        return None, math.inf
+    return mst, total
+
+
+# ---------- Kruskal ----------
+def kruskal(g):
+    g = as_csr(g)
+    eu, ev, ew = g.sorted_edges()
+    parent = [i for i in range(g.n)]
+    rank = [0] * g.n
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            return False
+        if rank[ra] < rank[rb]:
+            parent[ra] = rb
+        elif rank[ra] > rank[rb]:
+            parent[rb] = ra
+        else:
+            parent[rb] = ra
+            rank[ra] += 1
+        return True
+
+    mst = []
+    total = 0
+    target = g.num_nodes - 1
+
+    for i in range(len(eu)):
+        u, v = eu[i], ev[i]
+        if union(u, v):
+            w = ew[i]
+            mst.append((u, v, w))
+            total += w
+            if len(mst) == target:
+                break
+
+    if len(mst) != target:
+        return None, math.inf
+    return mst, total
+
+
+def kruskal_trace(g):
+    """Step events for kruskal: one accept or reject per scanned edge."""
+    g = as_csr(g)
+    eu, ev, ew = g.sorted_edges()
+    parent = list(range(g.n))
+    size = [1] * g.n
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    taken = 0
+    target = g.num_nodes - 1
+    for i in range(len(eu)):
+        if taken == target:
+            break
+        u, v, w = eu[i], ev[i], ew[i]
+        ru, rv = find(u), find(v)
+        if ru == rv:
+            yield REJECT, u, v, w
+            continue
+        if size[ru] < size[rv]:
+            ru, rv = rv, ru
+        parent[rv] = ru
+        size[ru] += size[rv]
+        taken += 1
+        yield ACCEPT, u, v, w
+
+
+# ---------- Dynamic MST (live editing) ----------
+class DynamicMST:
+    """Minimum spanning forest kept up to date while the graph is edited.
+
+    insert(): the new edge replaces the heaviest edge on the tree path it
+    closes, if it is lighter.  delete(): a removed tree edge is replaced by
+    the lightest graph edge across the cut, found by scanning only the
+    smaller of the two halves.  Both return (added, removed) edge lists so
+    the canvas can restyle just what changed.
+    """
+    def __init__(self, graph):
+        self.n = graph.n
+        self.nodes = graph.num_nodes
+        self.tree = [dict() for _ in range(graph.n)]
+        self.total = 0
+        self.size = 0
+        parent = list(range(graph.n))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for w, u, v in graph.edges:
+            ru, rv = find(u), find(v)
+            if ru != rv:
+                parent[ru] = rv
+                self._link(u, v, w)
+
+    def _link(self, u, v, w):
+        self.tree[u][v] = w
+        self.tree[v][u] = w
+        self.total += w
+        self.size += 1
+
+    def _cut(self, u, v):
+        w = self.tree[u].pop(v)
+        del self.tree[v][u]
+        self.total -= w
+        self.size -= 1
+        return w
+
+    def is_spanning_tree(self):
+        return self.size == self.nodes - 1
+
+    def edges(self):
+        return [(u, v, w) for u in range(self.n)
+                for v, w in self.tree[u].items() if u < v]
+
+    def add_node(self):
+        self.tree.append({})
+        self.n += 1
+        self.nodes += 1
+
+    def add_nodes(self, k):
+        """Follow Graph.add_nodes(k): k new isolated nodes, no tree edges."""
+        self.tree.extend({} for _ in range(k))
+        self.n += k
+        self.nodes += k
+
+    def remove_node(self):
+        """Call once the deleted node's edges have all gone through delete()."""
+        self.nodes -= 1
+
+    def _tree_path(self, u, v):
+        """Nodes on the forest path u -> v, or None if they are not connected."""
+        parent = {u: -1}
+        q = deque([u])
+        while q:
+            x = q.popleft()
+            if x == v:
+                path = []
+                while x != -1:
+                    path.append(x)
+                    x = parent[x]
+                return path
+            for y in self.tree[x]:
+                if y not in parent:
+                    parent[y] = x
+                    q.append(y)
+        return None
+
+    def insert(self, u, v, w):
+        if u == v:
+            return [], []
+        # a fresh, still isolated node cannot close a cycle: skip the path search
+        path = None if not self.tree[u] or not self.tree[v] else self._tree_path(u, v)
+        if path is None:
+            self._link(u, v, w)
+            return [(u, v, w)], []
+        a, b = max(zip(path, path[1:]), key=lambda e: self.tree[e[0]][e[1]])
+        if w >= self.tree[a][b]:
+            return [], []
+        old = (a, b, self._cut(a, b))
+        self._link(u, v, w)
+        return [(u, v, w)], [old]
+
+    def _smaller_side(self, u, v):
+        """Grow both halves one node at a time; return the one that runs out first."""
+        order = ([u], [v])
+        seen = ({u}, {v})
+        heads = [0, 0]
+        while True:
+            for k in (0, 1):
+                if heads[k] == len(order[k]):
+                    return seen[k]
+                x = order[k][heads[k]]
+                heads[k] += 1
+                for y in self.tree[x]:
+                    if y not in seen[k]:
+                        seen[k].add(y)
+                        order[k].append(y)
+
+    def delete(self, graph, u, v, w):
+        """Call after the edge is gone from `graph`."""
+        if self.tree[u].get(v) != w:
+            return [], []
+        self._cut(u, v)
+        side = self._smaller_side(u, v)
+        best = None
+        for x in side:
+            for y, ww in graph.adj[x]:
+                if y not in side and (best is None or ww < best[2]):
+                    best = (x, y, ww)
+        if best is None:
+            return [], [(u, v, w)]
+        self._link(*best)
+        return [best], [(u, v, w)]
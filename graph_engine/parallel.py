@@ -0,0 +1,224 @@
+"""Process-pool backends; imported only when one of them first runs."""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from array import array
+
+from .model import as_csr
+
+
+# ---------- Delta-stepping SSSP (process pool, shared memory) ----------
+_ds_state = None
+
+
+def _ds_attach(names, n, m, wcode, delta):
+    """Pool initializer: map the shared CSR and distance arrays once per worker."""
+    global _ds_state
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    views = [blk.buf.cast(code) for blk, code in zip(blocks, ("q", "q", wcode, "d"))]
+    _ds_state = (blocks, views[0][:n + 1], views[1][:m], views[2][:m], views[3][:n], delta)
+
+
+def _ds_relax_shared(nodes, light):
+    _, off, tgt, wts, dist, delta = _ds_state
+    return _ds_relax(off, tgt, wts, dist, delta, nodes, light)
+
+
+def _ds_relax(off, tgt, wts, dist, delta, nodes, light):
+    """Best improving request per target for the light (w <= delta) or heavy edges of `nodes`."""
+    best = {}
+    for u in nodes:
+        du = dist[u]
+        for i in range(off[u], off[u + 1]):
+            w = wts[i]
+            if (w <= delta) != light:
+                continue
+            v = tgt[i]
+            nd = du + w
+            if nd < dist[v] and (v not in best or nd < best[v][0]):
+                best[v] = (nd, u)
+    return best
+
+
+def delta_stepping(g, src, delta=None, workers=None, parallel_threshold=20000):
+    """Single-source distances by delta-stepping.  Returns (dist, parent) lists.
+
+    Nodes sit in buckets of width `delta` (default: max weight / average
+    degree).  The current bucket is emptied by repeated light-edge (w <= delta)
+    relaxation rounds, then heavy edges of everything it settled are relaxed
+    once.  Each round's frontier is split across a ProcessPoolExecutor whose
+    workers read the CSR and distance arrays from shared memory and return
+    requests; the parent process applies them.  Graphs with fewer than
+    `parallel_threshold` edges, or workers=1, relax in-process.
+    """
+    g = as_csr(g)
+    n = g.n
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    m = len(tgt)
+    if delta is None:
+        max_w = max(wts) if m else 1
+        delta = max_w / max(1.0, m / max(n, 1)) or 1
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    blocks = []
+    pool = None
+    if workers > 1 and m >= parallel_threshold:
+        sources = (off, tgt, wts, array("d", [math.inf]) * n)
+        for arr in sources:
+            blk = shared_memory.SharedMemory(create=True, size=max(arr.itemsize * len(arr), 1))
+            blk.buf[:arr.itemsize * len(arr)] = arr.tobytes()
+            blocks.append(blk)
+        dist = blocks[3].buf.cast("d")[:n]
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_ds_attach,
+            initargs=([b.name for b in blocks], n, m, wts.typecode, delta))
+    else:
+        dist = array("d", [math.inf]) * n
+    parent = [-1] * n
+
+    def relax(nodes, light):
+        # small frontiers are cheaper to relax here than to ship to workers
+        if pool is None or len(nodes) < 512 * workers:
+            return [_ds_relax(off, tgt, wts, dist, delta, nodes, light)]
+        step = -(-len(nodes) // workers)
+        return [f.result() for f in
+                [pool.submit(_ds_relax_shared, nodes[k:k + step], light)
+                 for k in range(0, len(nodes), step)]]
+
+    buckets = {}
+
+    def apply(results):
+        for best in results:
+            for v, (nd, u) in best.items():
+                old = dist[v]
+                if nd < old:
+                    if old != math.inf:
+                        buckets.get(int(old // delta), set()).discard(v)
+                    dist[v] = nd
+                    parent[v] = u
+                    buckets.setdefault(int(nd // delta), set()).add(v)
+
+    try:
+        dist[src] = 0
+        buckets[0] = {src}
+        while buckets:
+            i = min(buckets)
+            settled = []
+            while buckets.get(i):
+                frontier = list(buckets.pop(i))
+                settled.extend(frontier)
+                apply(relax(frontier, True))
+            buckets.pop(i, None)
+            apply(relax(settled, False))
+            for k in [k for k, b in buckets.items() if not b]:
+                del buckets[k]
+
+        result = list(dist)
+        if wts.typecode == "q":
+            result = [int(d) if d != math.inf else d for d in result]
+        return result, parent
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            del dist
+            for blk in blocks:
+                blk.close()
+                blk.unlink()
+
+
+# ---------- Borůvka (process pool) ----------
+_boruvka_edges = None
+
+
+def _boruvka_init(eu, ev):
+    global _boruvka_edges
+    _boruvka_edges = (eu, ev)
+
+
+def _boruvka_scan(lo, hi, comp):
+    eu, ev = _boruvka_edges
+    return _cheapest_edges(eu, ev, comp, lo, hi)
+
+
+def _cheapest_edges(eu, ev, comp, lo, hi):
+    """Cheapest outgoing edge index per component within edges[lo:hi].
+
+    Edges are sorted by weight, so the first index seen for a component is
+    its minimum, and ties are broken consistently by position.
+    """
+    best = {}
+    for i in range(lo, hi):
+        cu, cv = comp[eu[i]], comp[ev[i]]
+        if cu != cv:
+            if cu not in best:
+                best[cu] = i
+            if cv not in best:
+                best[cv] = i
+    return best
+
+
+def boruvka(g, workers=None, parallel_threshold=50000):
+    """Borůvka MST; returns (mst, total) like prim()/kruskal().
+
+    Each round scans edge partitions for every component's cheapest outgoing
+    edge in a ProcessPoolExecutor (the edge arrays are shipped to each worker
+    once), then contracts components.  Small graphs, or workers=1, scan in
+    this process instead.
+    """
+    g = as_csr(g)
+    n = g.n
+    eu, ev, ew = g.sorted_edges()
+    m = len(eu)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    mst = []
+    total = 0
+    target = g.num_nodes - 1
+    comp = array("q", range(n))
+
+    pool = None
+    if workers > 1 and m and m >= parallel_threshold:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_boruvka_init,
+                                   initargs=(eu, ev))
+    try:
+        while len(mst) < target:
+            if pool is not None:
+                step = -(-m // workers)
+                futures = [pool.submit(_boruvka_scan, lo, min(lo + step, m), comp)
+                           for lo in range(0, m, step)]
+                cheapest = {}
+                for f in futures:
+                    for c, i in f.result().items():
+                        if c not in cheapest or i < cheapest[c]:
+                            cheapest[c] = i
+            else:
+                cheapest = _cheapest_edges(eu, ev, comp, 0, m)
+            if not cheapest:
+                break
+
+            for i in sorted(set(cheapest.values())):
+                ru, rv = find(eu[i]), find(ev[i])
+                if ru != rv:
+                    parent[ru] = rv
+                    w = ew[i]
+                    mst.append((eu[i], ev[i], w))
+                    total += w
+            comp = array("q", (find(x) for x in range(n)))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if len(mst) != target:
+        return None, math.inf
+    return mst, total
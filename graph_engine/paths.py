@@ -0,0 +1,507 @@
+"""Point-to-point shortest paths: Dijkstra variants, A* and ALT."""
+from heapq import heappush, heappop
+import math
+from array import array
+
+from .heaps import IndexedDaryHeap, HeapQueue, BucketQueue
+from .model import as_csr
+from .traces import VISIT, RELAX, PUSH, POP, ACCEPT, REJECT
+
+
+# ---------- Dijkstra ----------
+DIAL_MAX_WEIGHT = 1 << 16  # larger integer weights fall back to heapq
+
+
+def dijkstra(g, src, dest, bidirectional=False, stats=None, queue="auto"):
+    """Shortest path src -> dest.  Returns (dist, path) or (inf, []).
+
+    bidirectional=True runs bidirectional_dijkstra instead.  `queue` picks
+    the priority queue: "heapq" (lazy deletion), "dary" (IndexedDaryHeap),
+    "bucket" (Dial's buckets, small non-negative integer weights only) or
+    "auto", which uses buckets whenever the weights allow it.  If a dict is
+    passed as `stats`, it receives "settled", "max_queue" and "queue".
+    """
+    if bidirectional:
+        return bidirectional_dijkstra(g, src, dest, stats)
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    dist = [math.inf] * g.n
+    parent = [-1] * g.n
+
+    dist[src] = 0
+    settled = 0
+
+    bound = g.integer_weight_bound()
+    if queue == "auto":
+        queue = "bucket" if bound is not None and bound <= DIAL_MAX_WEIGHT else "heapq"
+    elif queue == "bucket" and bound is None:
+        raise ValueError("bucket queue needs non-negative integer weights")
+
+    if queue == "bucket":
+        # Dial: every pending key lies in [d, d + C], so C + 1 circular
+        # buckets are enough and bucket d % (C + 1) holds exactly key d
+        nb = bound + 1
+        buckets = [[] for _ in range(nb)]
+        buckets[0].append(src)
+        pending = max_queue = 1
+        d = 0
+        while pending:
+            b = buckets[d % nb]
+            while not b:
+                d += 1
+                b = buckets[d % nb]
+            u = b.pop()
+            pending -= 1
+            if dist[u] != d:
+                continue
+            settled += 1
+            if u == dest:
+                break
+            for i in range(off[u], off[u + 1]):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    buckets[nd % nb].append(v)
+                    pending += 1
+            if pending > max_queue:
+                max_queue = pending
+    elif queue == "dary":
+        pq = IndexedDaryHeap(g.n)
+        pq.push_or_decrease(src, 0)
+        max_queue = 1
+        while pq:
+            d, u = pq.pop()
+            settled += 1
+            if u == dest:
+                break
+            for i in range(off[u], off[u + 1]):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    pq.push_or_decrease(v, nd)
+            if len(pq) > max_queue:
+                max_queue = len(pq)
+    else:
+        heap = [(0, src)]
+        max_queue = 1
+        while heap:
+            d, u = heappop(heap)
+            if d != dist[u]:
+                continue
+            settled += 1
+            if u == dest:
+                break
+
+            for i in range(off[u], off[u + 1]):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heappush(heap, (nd, v))
+            if len(heap) > max_queue:
+                max_queue = len(heap)
+
+    if stats is not None:
+        stats["settled"] = settled
+        stats["max_queue"] = max_queue
+        stats["queue"] = queue
+
+    if dist[dest] == math.inf:
+        return math.inf, []
+
+    path = []
+    cur = dest
+    while cur != -1:
+        path.append(cur)
+        cur = parent[cur]
+    path.reverse()
+
+    return dist[dest], path
+
+
+class ShortestPathTree:
+    """Dijkstra from one source that can be resumed for later destinations.
+
+    The queue, distances and parents survive between queries, so asking
+    for a node that is already settled is a parent-chain walk, and asking
+    for one further out only continues the search from where it stopped.
+    `queue` is "heapq", "bucket" or "auto" as for dijkstra().  Tied to one
+    CSR snapshot, like LandmarkIndex.
+    """
+    def __init__(self, g, src, queue="auto"):
+        g = as_csr(g)
+        self.graph = g
+        self.src = src
+        self.dist = [math.inf] * g.n
+        self.parent = [-1] * g.n
+        self.done = bytearray(g.n)
+        self.dist[src] = 0
+        bound = g.integer_weight_bound()
+        if queue == "auto":
+            queue = "bucket" if bound is not None and bound <= DIAL_MAX_WEIGHT else "heapq"
+        elif queue == "bucket" and bound is None:
+            raise ValueError("bucket queue needs non-negative integer weights")
+        self.queue = BucketQueue(bound) if queue == "bucket" else HeapQueue()
+        self.queue.push(0, src)
+        self.settled = 0
+
+    def is_valid_for(self, g):
+        return as_csr(g) is self.graph
+
+    def settle(self, dest):
+        """Advance until dest is settled or the queue runs dry; returns the
+        number of nodes settled by this call."""
+        g = self.graph
+        off, tgt, wts = g.offsets, g.targets, g.weights
+        dist, parent, done, queue = self.dist, self.parent, self.done, self.queue
+        pop, push = queue.pop, queue.push
+        before = self.settled
+        while queue and not done[dest]:
+            d, u = pop()
+            if done[u]:
+                continue
+            done[u] = 1
+            self.settled += 1
+            # relax before stopping so the queue stays valid for the next query
+            for i in range(off[u], off[u + 1]):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    push(nd, v)
+        return self.settled - before
+
+    def trace(self, dest=None):
+        """settle() as step events; dest=None runs until the queue is empty.
+
+        All state for a settled node is updated before its events are
+        yielded, so abandoning the trace part-way leaves the tree resumable.
+        """
+        g = self.graph
+        off, tgt, wts = g.offsets, g.targets, g.weights
+        dist, parent, done, queue = self.dist, self.parent, self.done, self.queue
+        pop, push = queue.pop, queue.push
+        while queue and (dest is None or not done[dest]):
+            d, u = pop()
+            if done[u]:
+                continue
+            done[u] = 1
+            self.settled += 1
+            p = parent[u]
+            steps = [(POP, p, u, d)]
+            if p != -1:
+                steps.append((ACCEPT, p, u, d))
+            steps.append((VISIT, p, u, d))
+            for i in range(off[u], off[u + 1]):
+                v = tgt[i]
+                nd = d + wts[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    push(nd, v)
+                    steps.append((RELAX, u, v, nd))
+                    steps.append((PUSH, u, v, nd))
+                else:
+                    steps.append((REJECT, u, v, nd))
+            yield from steps
+
+    def query(self, dest, stats=None):
+        """(dist, path) to dest, or (inf, []); `stats` gets "settled" (this
+        call), "total_settled" and "reused" (answered without searching)."""
+        settled = self.settle(dest)
+        if stats is not None:
+            stats["settled"] = settled
+            stats["total_settled"] = self.settled
+            stats["reused"] = settled == 0
+        if not self.done[dest]:
+            return math.inf, []
+        path = []
+        cur = dest
+        while cur != -1:
+            path.append(cur)
+            cur = self.parent[cur]
+        path.reverse()
+        return self.dist[dest], path
+
+
+def dijkstra_trace(g, src, dest=None):
+    """Step events for a heapq Dijkstra from src (until dest is settled)."""
+    return ShortestPathTree(g, src, queue="heapq").trace(dest)
+
+
+def bidirectional_dijkstra(g, src, dest, stats=None):
+    """Search forward from src and backward from dest, meet in the middle.
+
+    Always expands the side with the smaller queue head and stops once
+    top_f + top_b >= mu, where mu is the best src-dest length seen so far.
+    """
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    if src == dest:
+        if stats is not None:
+            stats["settled"] = 0
+        return 0, [src]
+
+    dist = ([math.inf] * g.n, [math.inf] * g.n)
+    parent = ([-1] * g.n, [-1] * g.n)
+    done = ([False] * g.n, [False] * g.n)
+    heaps = ([(0, src)], [(0, dest)])
+    dist[0][src] = 0
+    dist[1][dest] = 0
+
+    mu = math.inf
+    meet = None  # (a, b): a reached from src, b reached from dest
+    settled = 0
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = heappop(heaps[side])
+        if done[side][u] or d != dist[side][u]:
+            continue
+        done[side][u] = True
+        settled += 1
+
+        my_dist, my_parent = dist[side], parent[side]
+        other = dist[1 - side]
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            nd = d + wts[i]
+            if nd < my_dist[v]:
+                my_dist[v] = nd
+                my_parent[v] = u
+                heappush(heaps[side], (nd, v))
+            if other[v] != math.inf and nd + other[v] < mu:
+                mu = nd + other[v]
+                meet = (u, v) if side == 0 else (v, u)
+
+    if stats is not None:
+        stats["settled"] = settled
+
+    if meet is None:
+        return math.inf, []
+
+    a, b = meet
+    path = []
+    cur = a
+    while cur != -1:
+        path.append(cur)
+        cur = parent[0][cur]
+    path.reverse()
+    cur = b
+    while cur != -1:
+        path.append(cur)
+        cur = parent[1][cur]
+
+    return mu, path
+
+
+# ---------- A* ----------
+def euclidean_scale(g, positions):
+    """Smallest weight / straight-line-length ratio over all edges.
+
+    scale * distance(v, dest) never overestimates the remaining cost, so A*
+    with this heuristic stays exact.  Edges between coincident points are
+    ignored; returns 0.0 (plain Dijkstra) if nothing usable is found.
+    """
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    scale = math.inf
+    for u in range(g.n):
+        x1, y1 = positions[u]
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            if v < u:
+                continue
+            x2, y2 = positions[v]
+            length = math.hypot(x2 - x1, y2 - y1)
+            if length > 0:
+                ratio = wts[i] / length
+                if ratio < scale:
+                    scale = ratio
+    return 0.0 if scale == math.inf else scale
+
+
+def astar(g, src, dest, positions, scale=None, stats=None):
+    """A* shortest path using node coordinates as the heuristic.
+
+    Returns (dist, path) like dijkstra(); stats["settled"] counts expanded nodes.
+    """
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    if scale is None:
+        scale = euclidean_scale(g, positions)
+    tx, ty = positions[dest]
+
+    def h(v):
+        x, y = positions[v]
+        return scale * math.hypot(tx - x, ty - y)
+
+    dist = [math.inf] * g.n
+    parent = [-1] * g.n
+    closed = [False] * g.n
+
+    dist[src] = 0
+    heap = [(h(src), src)]
+    settled = 0
+
+    while heap:
+        f, u = heappop(heap)
+        if closed[u]:
+            continue
+        closed[u] = True
+        settled += 1
+        if u == dest:
+            break
+
+        d = dist[u]
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            nd = d + wts[i]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                closed[v] = False  # only matters if rounding broke consistency
+                heappush(heap, (nd + h(v), v))
+
+    if stats is not None:
+        stats["settled"] = settled
+
+    if dist[dest] == math.inf:
+        return math.inf, []
+
+    path = []
+    cur = dest
+    while cur != -1:
+        path.append(cur)
+        cur = parent[cur]
+    path.reverse()
+
+    return dist[dest], path
+
+
+# ---------- ALT (A*, landmarks, triangle inequality) ----------
+def single_source_distances(g, src):
+    """Full Dijkstra from src; returns the distance list (inf = unreachable)."""
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    dist = [math.inf] * g.n
+    dist[src] = 0
+    heap = [(0, src)]
+    while heap:
+        d, u = heappop(heap)
+        if d != dist[u]:
+            continue
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            nd = d + wts[i]
+            if nd < dist[v]:
+                dist[v] = nd
+                heappush(heap, (nd, v))
+    return dist
+
+
+class LandmarkIndex:
+    """Distance tables from k landmarks, picked by farthest-point selection.
+
+    Bound for the remaining cost v -> t:  max_L |d(L, t) - d(L, v)|.
+    The index is tied to one CSR snapshot; is_valid_for() turns False as
+    soon as the graph is edited and re-frozen.
+    """
+    def __init__(self, g, k=8):
+        g = as_csr(g)
+        self.graph = g
+        self.landmarks = []
+        self.tables = []
+        off = g.offsets
+        candidates = [u for u in range(g.n) if off[u + 1] > off[u]]
+        if not candidates:
+            return
+
+        # first landmark: farthest node from an arbitrary start
+        d0 = single_source_distances(g, candidates[0])
+        nearest = [math.inf] * g.n
+        nxt = max(candidates, key=lambda u: d0[u] if d0[u] != math.inf else -1)
+        while len(self.landmarks) < min(k, len(candidates)):
+            dist = single_source_distances(g, nxt)
+            self.landmarks.append(nxt)
+            self.tables.append(array("d", dist))
+            for u in candidates:
+                if dist[u] < nearest[u]:
+                    nearest[u] = dist[u]
+            # inf beats every finite distance, so other components get covered
+            nxt = max(candidates, key=lambda u: nearest[u])
+            if nearest[nxt] == 0:
+                break
+
+    def is_valid_for(self, g):
+        return as_csr(g) is self.graph
+
+    def lower_bound(self, v, t):
+        best = 0.0
+        for table in self.tables:
+            dv, dt = table[v], table[t]
+            if dv == math.inf or dt == math.inf:
+                if dv != dt:
+                    return math.inf  # v and t are in different components
+                continue
+            diff = abs(dt - dv)
+            if diff > best:
+                best = diff
+        return best
+
+
+def alt_search(index, src, dest, stats=None):
+    """Goal-directed A* using the landmark bounds from a LandmarkIndex."""
+    g = index.graph
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    bound = index.lower_bound
+
+    dist = [math.inf] * g.n
+    parent = [-1] * g.n
+    closed = [False] * g.n
+
+    dist[src] = 0
+    heap = [(bound(src, dest), src)]
+    settled = 0
+
+    while heap:
+        f, u = heappop(heap)
+        if closed[u] or f == math.inf:
+            continue
+        closed[u] = True
+        settled += 1
+        if u == dest:
+            break
+
+        d = dist[u]
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            nd = d + wts[i]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                closed[v] = False
+                heappush(heap, (nd + bound(v, dest), v))
+
+    if stats is not None:
+        stats["settled"] = settled
+
+    if dist[dest] == math.inf:
+        return math.inf, []
+
+    path = []
+    cur = dest
+    while cur != -1:
+        path.append(cur)
+        cur = parent[cur]
+    path.reverse()
+
+    return dist[dest], path
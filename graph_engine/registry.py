@@ -0,0 +1,100 @@
+"""Algorithm registry: stable names mapped to lazily imported backends."""
+from importlib import import_module
+
+
+class Algorithm:
+    """One registered algorithm.  `kind` says how it is called:
+
+        "source"  fn(g, src, ...)
+        "seeds"   fn(g, seeds, ...) with a collection of start nodes
+        "path"    fn(g, src, dest, ...), or fn(index, src, dest) when `index`
+                  names a preprocessing class built once as index(g, ...)
+        "global"  fn(g, ...)
+
+    `trace` names the matching step-event generator, if there is one.  The
+    backend module is imported the first time load() or a call needs it.
+    """
+    def __init__(self, name, title, kind, module, function, trace=None, index=None):
+        self.name = name
+        self.title = title
+        self.kind = kind
+        self.module = module
+        self.function = function
+        self.trace = trace
+        self.index = index
+
+    def _resolve(self, attr):
+        return getattr(import_module(f"{__package__}.{self.module}"), attr)
+
+    def load(self):
+        return self._resolve(self.function)
+
+    def load_trace(self):
+        return self._resolve(self.trace) if self.trace else None
+
+    def load_index(self):
+        return self._resolve(self.index) if self.index else None
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<Algorithm {self.name} ({self.kind}) {self.module}.{self.function}>"
+
+
+ALGORITHMS = {}
+
+
+def register(name, title, kind, module, function, trace=None, index=None):
+    ALGORITHMS[name] = Algorithm(name, title, kind, module, function, trace, index)
+    return ALGORITHMS[name]
+
+
+def get_algorithm(name):
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"unknown algorithm {name!r}") from None
+
+
+def algorithm_names(kind=None):
+    return [name for name, alg in ALGORITHMS.items() if kind is None or alg.kind == kind]
+
+
+def run(name, *args, **kwargs):
+    return get_algorithm(name)(*args, **kwargs)
+
+
+def prepare(name, g, *args, **kwargs):
+    """Build the preprocessing index of an indexed path algorithm for g."""
+    alg = get_algorithm(name)
+    cls = alg.load_index()
+    if cls is None:
+        raise ValueError(f"{name} needs no preprocessing")
+    return cls(g, *args, **kwargs)
+
+
+def trace(name, *args, **kwargs):
+    alg = get_algorithm(name)
+    fn = alg.load_trace()
+    if fn is None:
+        raise ValueError(f"{name} has no step trace")
+    return fn(*args, **kwargs)
+
+
+register("dfs", "DFS Spanning Tree", "source", "traversal", "dfs_spanning_tree", trace="dfs_trace")
+register("bfs", "BFS Spanning Tree", "source", "traversal", "bfs_spanning_tree", trace="bfs_trace")
+register("frontier", "Frontier BFS (NumPy)", "source", "frontier", "frontier_bfs_spanning_tree")
+register("msbfs", "Multi-Source BFS", "seeds", "traversal", "multi_source_bfs")
+register("prim", "Prim MST", "source", "mst", "prim", trace="prim_trace")
+register("delta", "Delta-stepping SSSP", "source", "parallel", "delta_stepping")
+register("dijkstra", "Dijkstra's Shortest Path", "path", "paths", "dijkstra",
+         trace="dijkstra_trace")
+register("bidijkstra", "Bidirectional Dijkstra", "path", "paths", "bidirectional_dijkstra")
+register("astar", "A* Path", "path", "paths", "astar")
+register("alt", "ALT Landmark Path", "path", "paths", "alt_search", index="LandmarkIndex")
+register("ch", "Contraction Hierarchy", "path", "hierarchy", "ch_query",
+         index="ContractionHierarchy")
+register("kruskal", "Kruskal MST", "global", "mst", "kruskal", trace="kruskal_trace")
+register("boruvka", "Borůvka MST", "global", "parallel", "boruvka")
+register("components", "Connected Components", "global", "traversal", "component_labels")
@@ -0,0 +1,38 @@
+"""Step-event traces shared by the GUI animation and the counters."""
+
+# ---------- Step-event traces ----------
+# A trace is a generator of (kind, u, v, w) tuples describing one run step
+# by step.  v is the node the step is about and u the node it came from
+# (-1 when there is none); w is the edge weight, or the tentative distance
+# for Dijkstra.  The GUI animates traces and the counters tally them, so
+# both read the same stream.
+VISIT = "visit"    # v reached for the first time (or settled, for Dijkstra)
+RELAX = "relax"    # edge u-v improved v's tentative distance
+PUSH = "push"      # v (or edge u-v) entered the queue/stack
+POP = "pop"        # v (or edge u-v) left the queue/stack
+ACCEPT = "accept"  # edge u-v joined the result tree
+REJECT = "reject"  # edge u-v was examined and discarded
+
+TRACE_KINDS = (VISIT, RELAX, PUSH, POP, ACCEPT, REJECT)
+
+
+def count_events(events, counts):
+    """Pass a trace through unchanged, tallying events by kind into `counts`."""
+    for ev in events:
+        kind = ev[0]
+        counts[kind] = counts.get(kind, 0) + 1
+        yield ev
+
+
+def replay_edges(edges):
+    """A trace of accept events for an already computed edge list."""
+    for u, v, w in edges:
+        yield ACCEPT, u, v, w
+
+
+def trace_counts(events):
+    """Drain a trace and return {kind: count} for every kind."""
+    counts = dict.fromkeys(TRACE_KINDS, 0)
+    for _ in count_events(events, counts):
+        pass
+    return counts
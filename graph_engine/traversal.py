@@ -0,0 +1,186 @@
+"""DFS and BFS spanning trees, multi-source BFS and component labels."""
+from collections import deque
+from array import array
+
+from .model import as_csr
+from .traces import VISIT, PUSH, POP, ACCEPT, REJECT
+
+
+# ---------- DFS ----------
+def dfs_tree_edges(g, start, visited=None):
+    """Yield DFS tree edges (u, v, w) in the same order as the recursive version.
+
+    Uses an explicit stack plus a per-node "next slot" cursor into the CSR
+    arrays, so deep chains never touch the recursion limit.  Pass your own
+    `visited` list to inspect reachability once the generator is exhausted.
+    """
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    if visited is None:
+        visited = [False] * g.n
+    nxt = array("q", off)
+
+    visited[start] = True
+    stack = [start]
+    while stack:
+        u = stack[-1]
+        i, end = nxt[u], off[u + 1]
+        while i < end and visited[tgt[i]]:
+            i += 1
+        if i == end:
+            nxt[u] = i
+            stack.pop()
+            continue
+        nxt[u] = i + 1
+        v = tgt[i]
+        visited[v] = True
+        yield u, v, wts[i]
+        stack.append(v)
+
+
+def dfs_spanning_tree(g, start):
+    g = as_csr(g)
+    visited = [False] * g.n
+    tree = list(dfs_tree_edges(g, start, visited))
+    unreach = [i for i in range(g.n) if not visited[i] and i not in g.removed]
+    return tree, unreach
+
+
+def dfs_trace(g, start):
+    """Step events for dfs_tree_edges; the accept events are its tree edges."""
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    nxt = array("q", off)
+
+    visited[start] = True
+    yield VISIT, -1, start, 0
+    yield PUSH, -1, start, 0
+    stack = [start]
+    while stack:
+        u = stack[-1]
+        i = nxt[u]
+        if i == off[u + 1]:
+            stack.pop()
+            yield POP, -1, u, 0
+            continue
+        nxt[u] = i + 1
+        v, w = tgt[i], wts[i]
+        if visited[v]:
+            yield REJECT, u, v, w
+            continue
+        visited[v] = True
+        yield ACCEPT, u, v, w
+        yield VISIT, u, v, w
+        yield PUSH, u, v, w
+        stack.append(v)
+
+
+# ---------- BFS ----------
+def bfs_spanning_tree(g, start):
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    tree = []
+    q = deque()
+
+    visited[start] = True
+    q.append(start)
+
+    while q:
+        u = q.popleft()
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            if not visited[v]:
+                visited[v] = True
+                tree.append((u, v, wts[i]))
+                q.append(v)
+
+    unreach = [i for i in range(g.n) if not visited[i] and i not in g.removed]
+    return tree, unreach
+
+
+def bfs_trace(g, start):
+    """Step events for bfs_spanning_tree; the accept events are its tree edges."""
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    visited = [False] * g.n
+    q = deque()
+
+    visited[start] = True
+    yield VISIT, -1, start, 0
+    yield PUSH, -1, start, 0
+    q.append(start)
+    while q:
+        u = q.popleft()
+        yield POP, -1, u, 0
+        for i in range(off[u], off[u + 1]):
+            v, w = tgt[i], wts[i]
+            if visited[v]:
+                yield REJECT, u, v, w
+                continue
+            visited[v] = True
+            yield ACCEPT, u, v, w
+            yield VISIT, u, v, w
+            q.append(v)
+            yield PUSH, u, v, w
+
+
+def multi_source_bfs(g, seeds):
+    """BFS from every seed at once: (forest edges, hop distance, nearest seed).
+
+    dist[v] is the hop count from v to its closest seed and nearest[v] that
+    seed, both -1 where no seed reaches v (and for deleted ids); ties go to
+    whichever seed's wave got there first.  The forest edges come in BFS
+    order, like bfs_spanning_tree.
+    """
+    g = as_csr(g)
+    off, tgt, wts = g.offsets, g.targets, g.weights
+    dist = array("q", [-1]) * g.n
+    nearest = array("q", [-1]) * g.n
+    tree = []
+    q = deque()
+    for s in seeds:
+        if dist[s] < 0:
+            dist[s] = 0
+            nearest[s] = s
+            q.append(s)
+
+    while q:
+        u = q.popleft()
+        du, su = dist[u] + 1, nearest[u]
+        for i in range(off[u], off[u + 1]):
+            v = tgt[i]
+            if dist[v] < 0:
+                dist[v] = du
+                nearest[v] = su
+                tree.append((u, v, wts[i]))
+                q.append(v)
+    return tree, dist, nearest
+
+
+# ---------- Connected components ----------
+def component_labels(g):
+    """Component label of every node in O(n + m).
+
+    Labels are 0, 1, 2, ... in order of each component's smallest node, so
+    max(labels) + 1 is the number of components.  Deleted ids keep -1.
+    """
+    g = as_csr(g)
+    off, tgt = g.offsets, g.targets
+    labels = array("q", [-1]) * g.n
+    count = 0
+    stack = []
+    for s in range(g.n):
+        if labels[s] >= 0 or s in g.removed:
+            continue
+        labels[s] = count
+        stack.append(s)
+        while stack:
+            u = stack.pop()
+            for v in tgt[off[u]:off[u + 1]]:
+                if labels[v] < 0:
+                    labels[v] = count
+                    stack.append(v)
+        count += 1
+    return labels
@@ -1,10 +1,11 @@
-from heapq import heappush, heappop
-from collections import deque
 import math
 import tkinter as tk
 from tkinter import simpledialog, messagebox, filedialog
 import json
 
+import graph_engine as engine
+from graph_engine import Graph, ResultCache, graph_from_json, graph_to_json
+
 INDEX_BASE = 1   # ยังอยู่ แต่ใน GUI เราใช้ชื่อ A,B,C แทนตัวเลข
 
 label_to_index = {}
@@ -38,160 +39,6 @@ def parse_vertex_token(tok: str) -> int:
     raise SystemExit
 
 
-class Graph:
-    def __init__(self, n):
-        self.n = n
-        self.adj = [[] for _ in range(n)]
-        self.edges = []
-
-    def add_edge(self, u, v, w):
-        self.adj[u].append((v, w))
-        self.adj[v].append((u, w))
-        self.edges.append((w, u, v))
-        self.edges.append((w, v, u))
-
-
-# ---------- DFS (เดิม) ----------
-def dfs_spanning_tree(g, start):
-    visited = [False] * g.n
-    tree = []
-
-    def dfs(u):
-        visited[u] = True
-        for v, w in g.adj[u]:
-            if not visited[v]:
-                tree.append((u, v, w))
-                dfs(v)
-
-    dfs(start)
-    unreach = [i for i in range(g.n) if not visited[i]]
-    return tree, unreach
-
-
-# ---------- BFS (เดิม) ----------
-def bfs_spanning_tree(g, start):
-    visited = [False] * g.n
-    tree = []
-    q = deque()
-
-    visited[start] = True
-    q.append(start)
-
-    while q:
-        u = q.popleft()
-        for v, w in g.adj[u]:
-            if not visited[v]:
-                visited[v] = True
-                tree.append((u, v, w))
-                q.append(v)
-
-    unreach = [i for i in g.n if not visited[i]]
-    return tree, unreach
-
-
-# ---------- Dijkstra (เดิม) ----------
-def dijkstra(g, src, dest):
-    dist = [math.inf] * g.n
-    parent = [-1] * g.n
-
-    dist[src] = 0
-    heap = [(0, src)]
-
-    while heap:
-        d, u = heappop(heap)
-        if d != dist[u]:
-            continue
-        if u == dest:
-            break
-
-        for v, w in g.adj[u]:
-            nd = d + w
-            if nd < dist[v]:
-                dist[v] = nd
-                parent[v] = u
-                heappush(heap, (nd, v))
-
-    if dist[dest] == math.inf:
-        return math.inf, []
-
-    path = []
-    cur = dest
-    while cur != -1:
-        path.append(cur)
-        cur = parent[cur]
-    path.reverse()
-
-    return dist[dest], path
-
-
-# ---------- Prim (เดิม) ----------
-def prim(g, start):
-    visited = [False] * g.n
-    visited[start] = True
-    heap = []
-
-    for v, w in g.adj[start]:
-        heappush(heap, (w, start, v))
-
-    mst = []
-    total = 0
-
-    while heap and len(mst) < g.n - 1:
-        w, u, v = heappop(heap)
-        if visited[v]:
-            continue
-
-        visited[v] = True
-        mst.append((u, v, w))
-        total += w
-
-        for to, ww in g.adj[v]:
-            if not visited[to]:
-                heappush(heap, (ww, v, to))
-
-    if len(mst) != g.n - 1:
-        return None, math.inf
-    return mst, total
-
-
-# ---------- Kruskal (เดิม) ----------
-def kruskal(g):
-    parent = [i for i in range(g.n)]
-    rank = [0] * g.n
-
-    def find(x):
-        if parent[x] != x:
-            parent[x] = find(parent[x])
-        return parent[x]
-
-    def union(a, b):
-        ra, rb = find(a), find(b)
-        if ra == rb:
-            return False
-        if rank[ra] < rank[rb]:
-            parent[ra] = rb
-        elif rank[ra] > rank[rb]:
-            parent[rb] = ra
-        else:
-            parent[rb] = ra
-            rank[ra] += 1
-        return True
-
-    mst = []
-    total = 0
-
-    for w, u, v in sorted(g.edges):
-        if union(u, v):
-            mst.append((u, v, w))
-            total += w
-            if len(mst) == g.n - 1:
-                break
-
-    if len(mst) != g.n - 1:
-        return None, math.inf
-    return mst, total
-
-
 # ---------- Helper: Floating Dropdown ----------
 
 class FloatingDropdown(tk.Frame):
@@ -501,6 +348,7 @@ class GraphGUI:
         self.text_to_edge = {}         # weight_text_id -> (u, v) canonical
 
         self.graph = Graph(0)
+        self.result_cache = ResultCache()
 
         # mode: build, mouse, select, move, dfs, bfs, prim, dijkstra_src, dijkstra_dest, del_node, del_edge
         self.mode = "build"
@@ -596,7 +444,7 @@ class GraphGUI:
         for i, (nx, ny) in enumerate(self.node_positions):
             dx = x - nx
             dy = y - ny
-            if dx * dx + dy * dy <= self.node_radius * self.node_radius:
+            if dx * dx + dy * dy <= self.node_radius * self.node_radius and i in self.node_items:
                 return i
         return None
 
@@ -878,7 +726,7 @@ class GraphGUI:
             y_min, y_max = sorted([y0, y1])
             self.selected_nodes = set()
             for idx, (nx, ny) in enumerate(self.node_positions):
-                if x_min <= nx <= x_max and y_min <= ny <= y_max:
+                if x_min <= nx <= x_max and y_min <= ny <= y_max and idx in self.node_items:
                     self.selected_nodes.add(idx)
             if self.selection_rect is not None:
                 self.canvas.delete(self.selection_rect)
@@ -897,19 +745,9 @@ class GraphGUI:
     # ---------- node / edge creation ----------
 
     def add_node(self, x, y):
-        idx = len(self.node_positions)
+        idx = self.graph.add_node()
         self.node_positions.append((x, y))
 
-        new_g = Graph(idx + 1)
-        for u in range(self.graph.n):
-            for v, w in self.graph.adj[u]:
-                if u < new_g.n and v < new_g.n:
-                    new_g.adj[u].append((v, w))
-        for w, u, v in self.graph.edges:
-            if u < new_g.n and v < new_g.n:
-                new_g.edges.append((w, u, v))
-        self.graph = new_g
-
         circle_id = self.canvas.create_oval(
             x - self.node_radius, y - self.node_radius,
             x + self.node_radius, y + self.node_radius,
@@ -975,21 +813,7 @@ class GraphGUI:
             return
         line_id, weight_id, w = item
 
-        self.graph.adj[u] = [
-            (to, ww) for (to, ww) in self.graph.adj[u]
-            if not (to == v and ww == w)
-        ]
-        self.graph.adj[v] = [
-            (to, ww) for (to, ww) in self.graph.adj[v]
-            if not (to == u and ww == w)
-        ]
-
-        new_edges = []
-        for ww, uu, vv in self.graph.edges:
-            if (uu == u and vv == v and ww == w) or (uu == v and vv == u and ww == w):
-                continue
-            new_edges.append((ww, uu, vv))
-        self.graph.edges = new_edges
+        self.graph.remove_edge(u, v, w)
 
         self.canvas.delete(line_id)
         self.canvas.delete(weight_id)
@@ -1004,64 +828,30 @@ class GraphGUI:
             del self.text_to_edge[weight_id]
 
     def delete_node(self, del_idx):
-        if del_idx < 0 or del_idx >= self.graph.n:
+        """ลบ node เดียว: id, ชื่อ และตำแหน่งของ node อื่นไม่เปลี่ยน"""
+        if not self.graph.is_live(del_idx):
             return
 
-        if del_idx in self.node_items:
-            circle_id, text_id = self.node_items[del_idx]
-            self.canvas.delete(circle_id)
-            self.canvas.delete(text_id)
-
-        to_delete_lines = set()
-        to_delete_texts = set()
-        for (u, v), (line_id, weight_id, w) in list(self.edge_items.items()):
-            if u == del_idx or v == del_idx:
-                to_delete_lines.add(line_id)
-                to_delete_texts.add(weight_id)
-                del self.edge_items[(u, v)]
+        circle_id, text_id = self.node_items.pop(del_idx)
+        self.canvas.delete(circle_id)
+        self.canvas.delete(text_id)
 
-        for line_id in to_delete_lines:
+        for u, v, w in self.graph.remove_node(del_idx):
+            item = self.edge_items.pop((u, v), None)
+            self.edge_items.pop((v, u), None)
+            if item is None:
+                continue  # parallel edge whose line is already gone
+            line_id, weight_id, _ = item
             self.canvas.delete(line_id)
-            if line_id in self.line_to_edge:
-                del self.line_to_edge[line_id]
-        for text_id in to_delete_texts:
-            self.canvas.delete(text_id)
-            if text_id in self.text_to_edge:
-                del self.text_to_edge[text_id]
-
-        old_n = self.graph.n
-        idx_map = {}
-        new_idx = 0
-        for old_idx in range(old_n):
-            if old_idx == del_idx:
-                continue
-            idx_map[old_idx] = new_idx
-            new_idx += 1
+            self.canvas.delete(weight_id)
+            self.line_to_edge.pop(line_id, None)
+            self.text_to_edge.pop(weight_id, None)
 
-        new_g = Graph(old_n - 1)
-        for w, u, v in self.graph.edges:
-            if u == del_idx or v == del_idx:
-                continue
-            nu = idx_map[u]
-            nv = idx_map[v]
-            if nu <= nv:
-                new_g.add_edge(nu, nv, w)
-        self.graph = new_g
-
-        new_positions = []
-        for old_idx, pos in enumerate(self.node_positions):
-            if old_idx == del_idx:
-                continue
-            new_positions.append(pos)
-        self.node_positions = new_positions
-
-        new_selected = set()
-        for old_idx, new_idx in idx_map.items():
-            if old_idx in self.selected_nodes:
-                new_selected.add(new_idx)
-        self.selected_nodes = new_selected
-
-        self.redraw_all()
+        self.selected_nodes.discard(del_idx)
+        if self.edge_start == del_idx:
+            self.edge_start = None
+        if self.dijkstra_src == del_idx:
+            self.dijkstra_src = None
 
     def delete_selected(self):
         if not self.selected_nodes:
@@ -1080,6 +870,8 @@ class GraphGUI:
         self.text_to_edge.clear()
 
         for idx, (x, y) in enumerate(self.node_positions):
+            if idx in self.graph.removed:
+                continue
             circle_id = self.canvas.create_oval(
                 x - self.node_radius, y - self.node_radius,
                 x + self.node_radius, y + self.node_radius,
@@ -1220,7 +1012,7 @@ class GraphGUI:
     # ---------- save / load ----------
 
     def save_graph(self):
-        if not self.node_positions:
+        if self.graph.num_nodes == 0:  # positions outlive deleted nodes
             messagebox.showinfo("Save graph", "ยังไม่มีกราฟให้บันทึก")
             return
         path = filedialog.asksaveasfilename(
@@ -1229,14 +1021,7 @@ class GraphGUI:
         )
         if not path:
             return
-        edges_set = set()
-        for w, u, v in self.graph.edges:
-            a, b = sorted((u, v))
-            edges_set.add((a, b, w))
-        data = {
-            "nodes": [{"x": x, "y": y} for (x, y) in self.node_positions],
-            "edges": [{"u": u, "v": v, "w": w} for (u, v, w) in edges_set],
-        }
+        data = graph_to_json(self.graph, self.node_positions)
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         self.log(f"บันทึกกราฟลงไฟล์:\n{path}", status="Saved")
@@ -1254,18 +1039,11 @@ class GraphGUI:
             messagebox.showerror("Load graph", f"ไม่สามารถอ่านไฟล์ได้:\n{e}")
             return
 
-        nodes = data.get("nodes", [])
-        edges = data.get("edges", [])
-
-        self.node_positions = [(float(n["x"]), float(n["y"])) for n in nodes]
-        n = len(self.node_positions)
-        self.graph = Graph(n)
-        for e in edges:
-            u = int(e["u"])
-            v = int(e["v"])
-            w = float(e["w"])
-            if 0 <= u < n and 0 <= v < n:
-                self.graph.add_edge(u, v, w)
+        try:
+            self.graph, self.node_positions = graph_from_json(data)
+        except (KeyError, TypeError, ValueError) as e:
+            messagebox.showerror("Load graph", f"ไฟล์กราฟไม่ถูกต้อง:\n{e}")
+            return
 
         self.selected_nodes = set()
         self.redraw_all()
@@ -1276,7 +1054,7 @@ class GraphGUI:
     # ---------- algorithm mode buttons ----------
 
     def choose_dfs(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("DFS", "ยังไม่มีจุดในกราฟ")
             return
         self.mode = "dfs"
@@ -1285,7 +1063,7 @@ class GraphGUI:
         messagebox.showinfo("DFS", "คลิกเลือกจุดเริ่มต้นบนกราฟ")
 
     def choose_bfs(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("BFS", "ยังไม่มีจุดในกราฟ")
             return
         self.mode = "bfs"
@@ -1294,7 +1072,7 @@ class GraphGUI:
         messagebox.showinfo("BFS", "คลิกเลือกจุดเริ่มต้นบนกราฟ")
 
     def choose_prim(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("Prim", "ยังไม่มีจุดในกราฟ")
             return
         self.mode = "prim"
@@ -1303,7 +1081,7 @@ class GraphGUI:
         messagebox.showinfo("Prim", "คลิกเลือกจุดเริ่มต้นบนกราฟ")
 
     def choose_dijkstra(self):
-        if self.graph.n == 0:
+        if self.graph.num_nodes == 0:
             messagebox.showwarning("Dijkstra", "ยังไม่มีจุดในกราฟ")
             return
         self.mode = "dijkstra_src"
@@ -1313,9 +1091,25 @@ class GraphGUI:
 
     # ---------- run algorithms + animation ----------
 
+    def cached(self, key, compute):
+        """Result of compute() for key at the current graph version, memoized."""
+        full_key = key + (self.graph.version,)
+        value = self.result_cache.get(full_key)
+        if value is not None:
+            return value, True
+        value = compute()
+        self.result_cache.put(full_key, value)
+        return value, False
+
+    def cache_summary(self, hit):
+        c = self.result_cache
+        return (f"Cache: {'hit' if hit else 'miss'} "
+                f"({c.hits}/{c.hits + c.misses} hits, {c.hit_rate():.0%})")
+
     def run_dfs(self, start):
-        tree, un = dfs_spanning_tree(self.graph, start)
-        header = ["DFS Tree:"]
+        (tree, un), hit = self.cached(("dfs", start),
+                                      lambda: engine.run("dfs", self.graph.freeze(), start))
+        header = ["DFS Tree:", self.cache_summary(hit)]
         if tree:
             seq = [format_vertex(start)]
             for u, v, w in tree:
@@ -1327,8 +1121,9 @@ class GraphGUI:
         self.animate_edges(tree, header)
 
     def run_bfs(self, start):
-        tree, un = bfs_spanning_tree(self.graph, start)
-        header = ["BFS Tree:"]
+        (tree, un), hit = self.cached(("bfs", start),
+                                      lambda: engine.run("bfs", self.graph.freeze(), start))
+        header = ["BFS Tree:", self.cache_summary(hit)]
         if tree:
             seq = [format_vertex(start)]
             for u, v, w in tree:
@@ -1340,31 +1135,34 @@ class GraphGUI:
         self.animate_edges(tree, header)
 
     def run_prim(self, start):
-        mst, total = prim(self.graph, start)
+        (mst, total), hit = self.cached(("prim", start),
+                                        lambda: engine.run("prim", self.graph.freeze(), start))
         if mst is None:
             messagebox.showinfo("Prim", "กราฟไม่เชื่อมถึงกัน ไม่มี MST")
             self.log("Prim MST: No MST (graph not connected)", status="No MST")
             return
-        header = [f"Prim MST (Total weight = {total}):"]
+        header = [f"Prim MST (Total weight = {total}):", self.cache_summary(hit)]
         if mst:
             edge_desc = " → ".join(f"{format_vertex(u)}-{format_vertex(v)}" for (u, v, w) in mst)
             header.append("Edges: " + edge_desc)
         self.animate_edges(mst, header)
 
     def run_kruskal(self):
-        mst, total = kruskal(self.graph)
+        (mst, total), hit = self.cached(("kruskal",),
+                                        lambda: engine.run("kruskal", self.graph.freeze()))
         if mst is None:
             messagebox.showinfo("Kruskal", "กราฟไม่เชื่อมถึงกัน ไม่มี MST")
             self.log("Kruskal MST: No MST (graph not connected)", status="No MST")
             return
-        header = [f"Kruskal MST (Total weight = {total}):"]
+        header = [f"Kruskal MST (Total weight = {total}):", self.cache_summary(hit)]
         if mst:
             edge_desc = " → ".join(f"{format_vertex(u)}-{format_vertex(v)}" for (u, v, w) in mst)
             header.append("Edges: " + edge_desc)
         self.animate_edges(mst, header)
 
     def run_dijkstra(self, src, dest):
-        dist, path = dijkstra(self.graph, src, dest)
+        (dist, path), hit = self.cached(("dijkstra", src, dest),
+                                        lambda: engine.run("dijkstra", self.graph.freeze(), src, dest))
         if dist == math.inf:
             messagebox.showinfo("Dijkstra", "ไม่มีเส้นทางจากจุดเริ่มถึงจุดปลาย")
             self.log("Dijkstra: No path.", status="No path")
@@ -1373,11 +1171,7 @@ class GraphGUI:
         edges = []
         for i in range(len(path) - 1):
             u, v = path[i], path[i + 1]
-            w = None
-            for to, ww in self.graph.adj[u]:
-                if to == v:
-                    w = ww
-                    break
+            w = self.graph.weight(u, v)
             if w is None:
                 continue
             edges.append((u, v, w))
@@ -1386,6 +1180,7 @@ class GraphGUI:
             "Dijkstra Shortest Path:",
             f"Distance = {dist}",
             "Path: " + " → ".join(format_vertex(v) for v in path),
+            self.cache_summary(hit),
             ""
         ]
 